@@ -9,11 +9,24 @@ positions numbered 0-99 and can be rotated left or right. The solution tracks:
 
 Part 1: Count how many times the dial lands on position 0
 Part 2: Count total times dial points at 0 (landings + crossings during rotation)
+
+The main block runs solve(), which is plain integer arithmetic over the input
+text with no C-extension dependencies, so for very large inputs it can be run
+unchanged under PyPy to have the loop JIT-compiled:
+
+    pypy3 day01.py input.txt
 """
 import argparse
 import sys
+from collections import namedtuple
 from enum import Enum
-from typing import TextIO
+from itertools import accumulate
+from typing import Final, Iterable, Iterator, TextIO
+
+# The puzzle's dial always has 100 positions and starts at 50; naming the
+# divisor once lets the hot loop treat it as a constant.
+DIAL_SIZE: Final[int] = 100
+START_POSITION: Final[int] = 50
 
 
 class RotDir(Enum):
@@ -26,31 +39,104 @@ class RotDir(Enum):
     LEFT = -1
     RIGHT = 1
 
-class Rotation(object):
+
+# Direction characters used in the puzzle input
+_DIRECTIONS: Final[dict[str, RotDir]] = {'L': RotDir.LEFT, 'R': RotDir.RIGHT}
+
+
+class Rotation(namedtuple("Rotation", ["direction", "steps"])):
     """
     Represents a single rotation instruction for the safe dial.
 
+    A namedtuple rather than a plain object, so instances carry no per-instance
+    __dict__; thousands are built when parsing a full input.
+
     Attributes:
         direction (RotDir): The direction to rotate (LEFT or RIGHT).
         steps (int): The number of positions to rotate.
+        signed_steps (int): steps with the direction's sign applied (negative
+            for LEFT), so callers can add it to a position directly.
     """
+    __slots__ = ()
 
-    def __init__(self, direction: RotDir, steps: int):
-        """
-        Initialize a rotation instruction.
-
-        Args:
-            direction: The direction to rotate (RotDir.LEFT or RotDir.RIGHT).
-            steps: The number of positions to rotate.
-        """
-        self.direction = direction
-        self.steps = steps
+    @property
+    def signed_steps(self) -> int:
+        """The step count with the direction's sign applied."""
+        return self.direction.value * self.steps
 
     def __str__(self):
         """Return string representation in format 'L68' or 'R48'."""
         dir_char = 'L' if self.direction == RotDir.LEFT else 'R'
         return f"{dir_char}{self.steps}"
 
+
+def _count_zeros(deltas: Iterable[int], start: int = START_POSITION,
+                 dial_size: int = DIAL_SIZE) -> tuple[int, int]:
+    """
+    Count landings on and passes through 0 for a sequence of signed deltas.
+
+    This is the inner loop of the solver, written over plain ints and local
+    variables only (no Rotation objects, Enum comparisons or attribute
+    lookups), so the same shape can be handed to a JIT or compiled as-is.
+    No positions are kept, so it works in constant memory over any iterable
+    of deltas (including a generator that parses as it goes).
+
+    Args:
+        deltas: Signed step counts, negative for left rotations.
+        start: The starting position of the dial (default START_POSITION).
+        dial_size: The number of positions on the dial (default DIAL_SIZE).
+
+    Returns:
+        A tuple (num_zeros, total) where num_zeros counts rotations ending at
+        0 and total adds the passes through 0 during rotations.
+
+    Example:
+        _count_zeros([-68, -30, 48], 50, 100) returns (1, 2)
+    """
+    current = start
+    num_zeros = 0
+    zero_crossings = 0
+    for delta in deltas:
+        end = current + delta
+        # Floor-dividing both ends counts the multiples of dial_size in
+        # (current, end]; shifting left moves down by one counts [end, current)
+        # instead, so either way the landing is included and the start is not.
+        shift = delta < 0
+        passes = abs((end - shift) // dial_size - (current - shift) // dial_size)
+        current = end % dial_size
+        landed = current == 0
+        num_zeros += landed
+        zero_crossings += passes - (landed and delta != 0)
+
+    return num_zeros, num_zeros + zero_crossings
+
+
+def _run_rotations(deltas: list[int], start: int = START_POSITION,
+                   dial_size: int = DIAL_SIZE) -> tuple[list[int], int]:
+    """
+    Run a sequence of signed step deltas over the dial, keeping each position.
+
+    The zero counting is done by _count_zeros(); the position after each
+    rotation is just the running sum of the deltas, wrapped to the dial.
+
+    Args:
+        deltas: Signed step counts, negative for left rotations.
+        start: The starting position of the dial (default START_POSITION).
+        dial_size: The number of positions on the dial (default DIAL_SIZE).
+
+    Returns:
+        A tuple (positions, zero_crossings) where positions lists the dial
+        position after each rotation and zero_crossings counts the times the
+        dial passed through 0 during the rotations (not counting landings).
+
+    Example:
+        _run_rotations([-68, -30], 50, 100) returns ([82, 52], 1)
+    """
+    num_zeros, total = _count_zeros(deltas, start, dial_size)
+    positions = [(start + offset) % dial_size for offset in accumulate(deltas)]
+    return positions, total - num_zeros
+
+
 class SafeState(object):
     """
     Tracks the state of a safe's rotary dial through a series of rotations.
@@ -64,8 +150,15 @@ class SafeState(object):
         current_position (int): The current position of the dial (0 to dial_size-1).
         zero_crossings (int): Count of times dial passed through 0 during rotations.
     """
+    __slots__ = ('dial_size', 'current_position', 'zero_crossings')
+
+    # Declared at class level so static compilers (mypyc, Cython pure-Python
+    # mode) can lay these out as native int fields.
+    dial_size: int
+    current_position: int
+    zero_crossings: int
 
-    def __init__(self, dial_size: int=100, current_position: int = 0):
+    def __init__(self, dial_size: int = DIAL_SIZE, current_position: int = 0):
         """
         Initialize the safe state.
 
@@ -77,33 +170,6 @@ class SafeState(object):
         self.current_position = current_position % dial_size
         self.zero_crossings = 0
 
-    def _count_multiples_between(self, start: int, end: int, multiple: int) -> int:
-        """
-        Count how many multiples of 'multiple' exist strictly between start and end.
-
-        This is used to count how many times the dial crosses position 0 (or any
-        other multiple of dial_size) during a rotation. The count excludes the
-        start and end positions themselves.
-
-        Args:
-            start: The starting position (unwrapped, can be negative or > dial_size).
-            end: The ending position (unwrapped, can be negative or > dial_size).
-            multiple: The multiple to count (typically dial_size for zero crossings).
-
-        Returns:
-            The number of multiples strictly between start and end.
-
-        Example:
-            _count_multiples_between(50, 150, 100) returns 1 (crosses 100 once)
-            _count_multiples_between(50, 250, 100) returns 2 (crosses 100 and 200)
-        """
-        min_pos, max_pos = min(start, end), max(start, end)
-        first = (min_pos // multiple + 1) * multiple
-        last = max_pos // multiple * multiple
-        if max_pos % multiple == 0:
-            last -= multiple
-        return max(0, (last - first) // multiple + 1)
-
     def rotate(self, rotation: Rotation):
         """
         Apply a rotation to the dial and update state.
@@ -121,11 +187,14 @@ class SafeState(object):
             Starting at position 50, rotating L68 moves to position 82 and
             crosses 0 once (going 50 -> 0 -> 82 in the counter-clockwise direction).
         """
+        dial_size = self.dial_size
         start = self.current_position
-        end = start + (rotation.steps if rotation.direction == RotDir.RIGHT else -rotation.steps)
+        delta = rotation.signed_steps
 
-        self.zero_crossings += self._count_multiples_between(start, end, self.dial_size)
-        self.current_position = end % self.dial_size
+        # The same zero counting as the batch kernel, for a single delta
+        num_zeros, total = _count_zeros((delta,), start, dial_size)
+        self.zero_crossings += total - num_zeros
+        self.current_position = (start + delta) % dial_size
 
     def get_position(self) -> int:
         """
@@ -152,6 +221,10 @@ class SafeState(object):
         """
         Apply a sequence of rotations and return all ending positions.
 
+        Rather than calling rotate() once per instruction, the rotations are
+        reduced to their signed step deltas and run through _run_rotations()
+        in a single loop over plain ints.
+
         Args:
             rotations: A list of Rotation objects to apply in sequence.
 
@@ -162,10 +235,12 @@ class SafeState(object):
         Example:
             Starting at 50, applying [L68, L30] returns [82, 52].
         """
-        positions = []
-        for rotation in rotations:
-            self.rotate(rotation)
-            positions.append(self.get_position())
+        deltas = [r.signed_steps for r in rotations]
+        positions, zero_crossings = _run_rotations(deltas, self.current_position, self.dial_size)
+
+        self.zero_crossings += zero_crossings
+        if positions:
+            self.current_position = positions[-1]
 
         return positions
 
@@ -195,29 +270,55 @@ def parse_rotation_line(line: str) -> Rotation:
     if not line:
         raise ValueError("Empty line cannot be parsed as rotation")
 
-    direction_char = line[0]
-    steps = int(line[1:])
+    return _parse_rotation_token(line)
+
+
+def _split_rotation_token(token: str) -> tuple[RotDir, int]:
+    """
+    Split an already-stripped, non-empty token like 'L68' into (direction, steps).
+
+    All token validation lives here, so the Rotation-building and the
+    signed-step parsers accept and reject exactly the same input.
+
+    Raises:
+        ValueError: If the direction character is invalid or the number cannot
+                   be parsed as an integer.
+    """
+    direction_char = token[0]
+    steps = int(token[1:])
 
-    if direction_char == 'L':
-        direction = RotDir.LEFT
-    elif direction_char == 'R':
-        direction = RotDir.RIGHT
-    else:
+    direction = _DIRECTIONS.get(direction_char)
+    if direction is None:
         raise ValueError(f"Invalid direction character: {direction_char}")
 
-    return Rotation(direction, steps)
+    return direction, steps
+
+
+def _parse_rotation_token(token: str) -> Rotation:
+    """
+    Parse an already-stripped, non-empty token like 'L68' into a Rotation.
+
+    This is the part of parse_rotation_line() that callers which have
+    already stripped and skipped blank lines can use directly.
+
+    Raises:
+        ValueError: If the direction character is invalid or the number cannot
+                   be parsed as an integer.
+    """
+    return Rotation(*_split_rotation_token(token))
 
 
 def get_inputs(fileobj: TextIO) -> list[Rotation]:
     """
     Read and parse rotation instructions from a file-like object.
 
-    Reads lines from the file, where each line should be in the format 'L<number>'
-    or 'R<number>'. Empty lines are skipped.
+    Reads the whole file at once and splits it on whitespace, which yields
+    exactly the non-empty 'L<number>' / 'R<number>' tokens in a single C-level
+    pass, so blank lines and surrounding whitespace need no per-line strip().
 
     Args:
-        fileobj: A file-like object (or any iterator of strings) containing
-                rotation instructions, one per line.
+        fileobj: A file-like object containing rotation instructions, one
+                per line.
 
     Returns:
         A list of Rotation objects parsed from the non-empty lines.
@@ -230,13 +331,49 @@ def get_inputs(fileobj: TextIO) -> list[Rotation]:
             R48
         This function returns a list of 3 Rotation objects.
     """
-    rotations = []
-    for line in fileobj:
-        line = line.strip()
-        if not line:
-            continue
-        rotations.append(parse_rotation_line(line))
-    return rotations
+    return [_parse_rotation_token(token) for token in fileobj.read().split()]
+
+
+def _iter_signed_steps(text: str) -> Iterator[int]:
+    """
+    Yield the signed step count of each whitespace-separated token in text.
+
+    Raises:
+        ValueError: If a token has an invalid direction character or the
+                   number cannot be parsed as an integer.
+    """
+    for token in text.split():
+        direction, steps = _split_rotation_token(token)
+        yield direction.value * steps
+
+
+def solve(text: str, start: int = START_POSITION, dial_size: int = DIAL_SIZE) -> tuple[int, int]:
+    """
+    Parse rotation instructions and run them over the dial in a single pass.
+
+    Unlike get_inputs() followed by SafeState.apply_rotations(), no Rotation
+    objects or position list are built: each whitespace-separated token is
+    turned into a signed step and folded straight into the running counters
+    by _count_zeros().
+
+    Args:
+        text: The full puzzle input, tokens like 'L68' or 'R48'.
+        start: The starting position of the dial (default START_POSITION).
+        dial_size: The number of positions on the dial (default DIAL_SIZE).
+
+    Returns:
+        A tuple (num_zeros, total) where num_zeros counts rotations ending at
+        0 (Part 1) and total adds the passes through 0 during rotations
+        (Part 2).
+
+    Raises:
+        ValueError: If a token has an invalid direction character or the
+                   number cannot be parsed as an integer.
+
+    Example:
+        solve("L68\nL30\nR48") returns (1, 2)
+    """
+    return _count_zeros(_iter_signed_steps(text), start, dial_size)
 
 
 if __name__ == "__main__":
@@ -244,15 +381,10 @@ if __name__ == "__main__":
     parser.add_argument('file', type=argparse.FileType('r'), default=sys.stdin)
     args = parser.parse_args()
 
-    rotations = get_inputs(args.file)
-
-    safe = SafeState(dial_size=100, current_position=50)
-    positions = safe.apply_rotations(rotations)
+    num_zeros, total = solve(args.file.read())
 
     print("Part 1: number of zeros in positions")
-    num_zeros = positions.count(0)
     print(num_zeros)
 
     print("Part 2: total zero crossings during rotations")
-    total_zero_crossings = safe.get_zero_crossings()
-    print(total_zero_crossings + num_zeros)
\ No newline at end of file
+    print(total)
@@ -13,6 +13,7 @@ Rotation = solution.Rotation
 SafeState = solution.SafeState
 parse_rotation_line = solution.parse_rotation_line
 get_inputs = solution.get_inputs
+solve = solution.solve
 
 
 class TestParsing(unittest.TestCase):
@@ -36,6 +37,13 @@ class TestParsing(unittest.TestCase):
         self.assertEqual(rotation.direction, RotDir.LEFT)
         self.assertEqual(rotation.steps, 30)
 
+    def test_parse_signed_steps(self):
+        """Test that signed_steps is negative for left and positive for right."""
+        self.assertEqual(parse_rotation_line("L68").signed_steps, -68)
+        self.assertEqual(parse_rotation_line("R48").signed_steps, 48)
+        self.assertEqual(parse_rotation_line("L68")._replace(steps=5).signed_steps, -5)
+        self.assertEqual(tuple(parse_rotation_line("R48")), (RotDir.RIGHT, 48))
+
     def test_parse_invalid_direction(self):
         """Test parsing raises error for invalid direction."""
         with self.assertRaises(ValueError):
@@ -200,6 +208,25 @@ class TestZeroCrossings(unittest.TestCase):
                     f"{msg}: expected 0 crossings"
                 )
 
+    def test_multiple_laps_zero_crossings(self):
+        """Test rotations of more than one full turn count every pass through 0."""
+        test_cases = [
+            # (start_pos, rotation_line, expected_position, expected_crossings)
+            (50, "R1000", 50, 10),
+            (50, "L1000", 50, 10),
+            (50, "L250", 0, 2),
+            (0, "R300", 0, 2),
+            (0, "L100", 0, 0),
+        ]
+
+        for start_pos, line, expected_pos, expected_crossings in test_cases:
+            with self.subTest(start=start_pos, line=line):
+                safe = SafeState(dial_size=100, current_position=start_pos)
+                positions = safe.apply_rotations([parse_rotation_line(line)])
+
+                self.assertEqual(positions, [expected_pos])
+                self.assertEqual(safe.get_zero_crossings(), expected_crossings)
+
     def test_complete_sequence_zero_crossings(self):
         """Test the complete rotation sequence tracks zero crossings correctly."""
         rotation_lines = [
@@ -264,5 +291,28 @@ class TestZeroCrossings(unittest.TestCase):
         )
 
 
+class TestSolve(unittest.TestCase):
+    """Test the single-pass parse-and-run solver."""
+
+    def test_example(self):
+        """Test the problem example gives 3 landings and 6 total zeros."""
+        with open('ex01.txt') as f:
+            self.assertEqual(solve(f.read()), (3, 6))
+
+    def test_matches_safe_state(self):
+        """Test solve agrees with SafeState on multi-lap rotations."""
+        text = "R1000\nL250\n\nR300\nL5\nL100\nR49\nL1\n"
+        safe = SafeState(dial_size=100, current_position=50)
+        positions = safe.apply_rotations(get_inputs(StringIO(text)))
+        num_zeros = positions.count(0)
+
+        self.assertEqual(solve(text), (num_zeros, num_zeros + safe.get_zero_crossings()))
+
+    def test_invalid_direction(self):
+        """Test solve raises error for invalid direction."""
+        with self.assertRaises(ValueError):
+            solve("L10\nX50\n")
+
+
 if __name__ == '__main__':
     unittest.main()
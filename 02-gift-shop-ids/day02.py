@@ -13,23 +13,42 @@ Part 2: Find invalid IDs with 2 or more repetitions.
 """
 import argparse
 import sys
-from itertools import count, takewhile
-from typing import TextIO, Iterator
+from bisect import bisect_right
+from typing import Iterator, NamedTuple, TextIO
 
+# Powers of ten up to 10**19, enough for any 64-bit ID; larger values fall
+# back to str() in digit_count().
+POW10 = [10 ** k for k in range(20)]
 
-class Range(object):
-    """Represents an inclusive range of integers [start, end]."""
 
-    def __init__(self, start: int, end: int):
-        """
-        Initialize a Range.
+def digit_count(n: int) -> int:
+    """
+    Return the number of decimal digits in a positive integer.
 
-        Args:
-            start: The lower bound of the range (inclusive).
-            end: The upper bound of the range (inclusive).
-        """
-        self.start = start
-        self.end = end
+    Uses a binary search over POW10 rather than len(str(n)), avoiding the
+    int-to-string conversion for IDs that fit in 64 bits.
+
+    Example:
+        >>> digit_count(1012)
+        4
+    """
+    if n < POW10[-1]:
+        return bisect_right(POW10, n)
+    return len(str(n))
+
+
+class Range(NamedTuple):
+    """
+    Represents an inclusive range of integers [start, end].
+
+    A NamedTuple, so instances are plain tuples with no per-instance __dict__.
+
+    Attributes:
+        start: The lower bound of the range (inclusive).
+        end: The upper bound of the range (inclusive).
+    """
+    start: int
+    end: int
 
     def __str__(self):
         """Return string representation in the format 'start-end'."""
@@ -53,7 +72,8 @@ def get_inputs(fileobj: TextIO) -> list[Range]:
     Parse input file containing comma-separated ranges.
 
     Each line contains one or more ranges in the format "start-end,start-end,...".
-    Empty lines are ignored.
+    Empty lines are ignored; any other token that is not two integers joined
+    by a single '-' raises ValueError.
 
     Args:
         fileobj: Text file object to read from.
@@ -61,6 +81,9 @@ def get_inputs(fileobj: TextIO) -> list[Range]:
     Returns:
         List of Range objects parsed from the input.
 
+    Raises:
+        ValueError: If a token is not of the form "start-end".
+
     Example:
         Input line: "11-22,95-115,998-1012"
         Returns: [Range(11, 22), Range(95, 115), Range(998, 1012)]
@@ -71,14 +94,45 @@ def get_inputs(fileobj: TextIO) -> list[Range]:
         if not line:
             continue
 
-        ranges = line.split(',')
-        for range_str in ranges:
-            input_ranges.append(Range(*map(int, range_str.split('-'))))
+        for range_str in line.split(','):
+            start, sep, end = range_str.partition('-')
+            if not sep:
+                raise ValueError(f"invalid range: {range_str!r}")
+            input_ranges.append(Range(int(start), int(end)))
 
     return input_ranges
 
 
-def digit_concatenations(r: Range, ncopies: int=2) -> Iterator[int]:
+def _base_ranges(r: Range, ncopies: int,
+                 digits: tuple[int, int] | None = None) -> Iterator[tuple[int, int, int]]:
+    """
+    Yield (multiplier, i_min, i_max) for each base length that can produce invalid IDs in r.
+
+    Repeating a base i of L digits ncopies times is i * multiplier, where the
+    multiplier is the repunit 1...1 written in base 10**L (e.g. 12 -> 1212 is
+    12 * 101). For each base length whose repeats have a digit count between
+    those of r.start and r.end, the bases whose repeats fall in
+    [r.start, r.end] are exactly ceil(r.start / multiplier) .. r.end // multiplier,
+    clipped to L-digit bases. The run may be empty (i_max < i_min).
+
+    digits, if given, is (digit_count(r.start), digit_count(r.end)), so callers
+    looping over several repeat counts for the same range compute it once.
+    """
+    lo, hi = r
+    lo_digits, hi_digits = digits or (digit_count(lo), digit_count(hi))
+    pow10 = POW10 if hi_digits < len(POW10) else [10 ** k for k in range(hi_digits + 1)]
+    min_length = max(1, -(-lo_digits // ncopies))
+    max_length = hi_digits // ncopies
+    for length in range(min_length, max_length + 1):
+        base = pow10[length]
+        multiplier = (pow10[length * ncopies] - 1) // (base - 1)
+        i_min = max(base // 10, -(-lo // multiplier))
+        i_max = min(base - 1, hi // multiplier)
+        yield multiplier, i_min, i_max
+
+
+def digit_concatenations(r: Range, ncopies: int=2,
+                         digits: tuple[int, int] | None = None) -> Iterator[int]:
     """
     Generate invalid IDs in a range that are made of a digit sequence repeated exactly ncopies times.
 
@@ -87,11 +141,13 @@ def digit_concatenations(r: Range, ncopies: int=2) -> Iterator[int]:
     - 123123 = "123" repeated 2 times
     - 1212121212 = "12" repeated 5 times
 
-    The function efficiently generates these numbers without checking every number in the range.
+    The function generates these numbers directly from the range of base
+    sequences that can produce them, without checking every number in the range.
 
     Args:
         r: The range to search within.
         ncopies: The number of times the base sequence should be repeated.
+        digits: Optional precomputed (digit_count(r.start), digit_count(r.end)).
 
     Yields:
         Invalid IDs within the range, in ascending order.
@@ -102,25 +158,54 @@ def digit_concatenations(r: Range, ncopies: int=2) -> Iterator[int]:
         >>> list(digit_concatenations(Range(95, 115), 3))
         [111]
     """
-    # Determine the length of the base digit sequence
-    # For a range starting at 1188511880, with ncopies=2, we want base length 5 (11885)
-    length = len(str(r.start)) // ncopies
-    start = int(str(r.start)[:length]) if length > 0 else 0
+    for multiplier, i_min, i_max in _base_ranges(r, ncopies, digits):
+        for i in range(i_min, i_max + 1):
+            yield i * multiplier
+
+
+def sum_digit_concatenations(r: Range, ncopies: int=2,
+                             digits: tuple[int, int] | None = None) -> int:
+    """
+    Sum the invalid IDs in a range made of a digit sequence repeated exactly ncopies times.
+
+    Equivalent to sum(digit_concatenations(r, ncopies)), but since every
+    candidate is base * multiplier for a contiguous run of bases, each run's
+    total is an arithmetic series, multiplier * (i_min + i_max) * count / 2.
+    The work is O(1) per base length instead of one step per invalid ID.
+
+    Args:
+        r: The range to search within.
+        ncopies: The number of times the base sequence should be repeated.
+        digits: Optional precomputed (digit_count(r.start), digit_count(r.end)).
+
+    Returns:
+        The sum of the invalid IDs within the range.
+
+    Example:
+        >>> sum_digit_concatenations(Range(11, 22), 2)
+        33
+    """
+    return sum(multiplier * (i_min + i_max) * (i_max - i_min + 1) // 2
+               for multiplier, i_min, i_max in _base_ranges(r, ncopies, digits)
+               if i_max >= i_min)
 
-    # If the range start doesn't evenly divide by ncopies, round up the length
-    # This ensures we start with a base number that, when repeated, is large enough
-    if len(str(r.start)) % ncopies != 0:
-        length += ncopies - (len(str(r.start)) % ncopies)
-        start = 10**(length-1)  # Start at the smallest number with this many digits
 
-    def make_candidate(i):
-        """Create an invalid ID by repeating the digits of i exactly ncopies times."""
-        return int(str(i) * ncopies)
+def _repeat_counts(digits: tuple[int, int]) -> Iterator[int]:
+    """
+    Yield the repeat counts (ncopies >= 2) that can produce an ID of a usable length.
 
-    # Generate candidates starting from 'start', filtering to ensure they're >= r.start
-    candidates = (make_candidate(i) for i in count(start) if make_candidate(i) >= r.start)
-    # Yield candidates while they're still within the range
-    yield from takewhile(r.contains, candidates)
+    An ID made of ncopies copies has a multiple of ncopies digits, so a range
+    whose endpoints have lo_digits and hi_digits digits can only contain one
+    if the smallest such multiple not below lo_digits is at most hi_digits.
+    For most ranges this leaves one or two repeat counts to check.
+
+    Args:
+        digits: (digit_count(r.start), digit_count(r.end)) for the range.
+    """
+    lo_digits, hi_digits = digits
+    for ncopies in range(2, hi_digits + 1):
+        if -(-lo_digits // ncopies) * ncopies <= hi_digits:
+            yield ncopies
 
 
 def find_all_invalid_ids(r: Range) -> set[int]:
@@ -144,13 +229,65 @@ def find_all_invalid_ids(r: Range) -> set[int]:
         [999, 1010]
     """
     invalid_ids = set()
-    # Check all possible repetition counts from 2 up to the number of digits in range.end
-    # (No need to check beyond that, as those numbers would be too large)
-    for ncopies in range(2, len(str(r.end)) + 1):
-        invalid_ids.update(digit_concatenations(r, ncopies))
+    # Check the repetition counts from 2 up to the number of digits in range.end
+    # that can produce an ID with a digit count inside the range
+    digits = digit_count(r.start), digit_count(r.end)
+    for ncopies in _repeat_counts(digits):
+        invalid_ids.update(digit_concatenations(r, ncopies, digits))
     return invalid_ids
 
 
+def _mobius(n: int) -> int:
+    """
+    Return the Moebius function of n.
+
+    This is 0 if n has a repeated prime factor, otherwise -1 or 1 for an odd
+    or even number of prime factors.
+    """
+    result = 1
+    p = 2
+    while p * p <= n:
+        if n % p == 0:
+            n //= p
+            if n % p == 0:
+                return 0
+            result = -result
+        p += 1
+    return -result if n > 1 else result
+
+
+def sum_all_invalid_ids(r: Range) -> int:
+    """
+    Sum the invalid IDs in a range with 2 or more repetitions, each counted once.
+
+    Equivalent to sum(find_all_invalid_ids(r)) without building the set. An ID
+    that is k copies of some base is also p copies for every prime p dividing
+    k, so the IDs with k copies for composite k are already included in the
+    sums for its prime factors. Inclusion-exclusion over the repeat counts
+    therefore gives each distinct ID exactly once: the sum for ncopies = k is
+    weighted by -mobius(k). Products of two primes (e.g. 6, for IDs like
+    111111 that are both 2 and 3 copies) are subtracted back out, and counts
+    with a squared factor (e.g. 4) get weight 0.
+
+    Args:
+        r: The range to search within.
+
+    Returns:
+        The sum of all distinct invalid IDs found in the range.
+
+    Example:
+        >>> sum_all_invalid_ids(Range(95, 115))
+        210
+    """
+    total = 0
+    digits = digit_count(r.start), digit_count(r.end)
+    for ncopies in _repeat_counts(digits):
+        weight = -_mobius(ncopies)
+        if weight:
+            total += weight * sum_digit_concatenations(r, ncopies, digits)
+    return total
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
         prog='02',
@@ -164,10 +301,10 @@ if __name__ == "__main__":
 
     # Part 1: Sum of all invalid IDs with exactly 2 repetitions
     print("Part 1")
-    tot = sum(sum(digit_concatenations(r, 2)) for r in ranges)
+    tot = sum(sum_digit_concatenations(r, 2) for r in ranges)
     print(tot)
 
     # Part 2: Sum of all invalid IDs with 2 or more repetitions
     print("Part 2")
-    tot = sum(sum(find_all_invalid_ids(r)) for r in ranges)
+    tot = sum(sum_all_invalid_ids(r) for r in ranges)
     print(tot)
\ No newline at end of file
@@ -5,9 +5,12 @@ from importlib import import_module
 
 import day02 as solution
 Range = solution.Range
+digit_count = solution.digit_count
 get_inputs = solution.get_inputs
 digit_concatenations = solution.digit_concatenations
 find_all_invalid_ids = solution.find_all_invalid_ids
+sum_digit_concatenations = solution.sum_digit_concatenations
+sum_all_invalid_ids = solution.sum_all_invalid_ids
 
 
 class TestRange(unittest.TestCase):
@@ -24,6 +27,13 @@ class TestRange(unittest.TestCase):
         self.assertEqual(str(r), "11-22")
 
 
+class TestDigitCount(unittest.TestCase):
+    def test_digit_count(self):
+        for n in [1, 9, 10, 99, 100, 1188511880, 10**19 - 1, 10**19, 10**25 + 3]:
+            with self.subTest(n=n):
+                self.assertEqual(digit_count(n), len(str(n)))
+
+
 class TestGetInputs(unittest.TestCase):
     def test_single_range(self):
         input_str = "11-22\n"
@@ -48,6 +58,12 @@ class TestGetInputs(unittest.TestCase):
         ranges = get_inputs(StringIO(input_str))
         self.assertEqual(len(ranges), 11)
 
+    def test_malformed_ranges_rejected(self):
+        for input_str in ["11-22,abc,95-115\n", "1-2-3\n", "-5-10\n", "11-22,\n", "12\n"]:
+            with self.subTest(input_str=input_str):
+                with self.assertRaises(ValueError):
+                    get_inputs(StringIO(input_str))
+
 
 class TestDigitConcatenations(unittest.TestCase):
     """Test finding invalid IDs (numbers made of repeated digit sequences)."""
@@ -87,6 +103,19 @@ class TestDigitConcatenations(unittest.TestCase):
         self.assertNotIn(101, invalid_ids)
 
 
+class TestSumDigitConcatenations(unittest.TestCase):
+    """Test the closed-form sum of invalid IDs matches summing them one by one."""
+
+    def test_matches_enumeration(self):
+        ranges = [Range(11, 22), Range(95, 115), Range(998, 1012), Range(1, 9),
+                  Range(10, 111111), Range(1188511880, 1188511890), Range(473, 36307)]
+        for r in ranges:
+            for ncopies in range(2, 7):
+                with self.subTest(r=str(r), ncopies=ncopies):
+                    self.assertEqual(sum_digit_concatenations(r, ncopies),
+                                     sum(digit_concatenations(r, ncopies)))
+
+
 class TestHigherOrderRepetitions(unittest.TestCase):
     """Test that we can detect patterns repeated 2+ times."""
 
@@ -130,6 +159,28 @@ class TestFindAllInvalidIds(unittest.TestCase):
         self.assertIn(111, invalid_ids)
         self.assertIn(222, invalid_ids)
 
+    def test_more_copies_than_start_digits(self):
+        """Repetition counts larger than the start's digit count are still found."""
+        r = Range(473, 36307)
+        invalid_ids = find_all_invalid_ids(r)
+        self.assertIn(1111, invalid_ids)
+        self.assertIn(11111, invalid_ids)
+        self.assertIn(33333, invalid_ids)
+        self.assertNotIn(44444, invalid_ids)
+        self.assertEqual(list(digit_concatenations(r, 5)), [11111, 22222, 33333])
+
+
+class TestSumAllInvalidIds(unittest.TestCase):
+    """Test the inclusion-exclusion sum matches summing the de-duplicated set."""
+
+    def test_matches_set_sum(self):
+        ranges = [Range(11, 22), Range(95, 115), Range(998, 1012), Range(10, 111111),
+                  Range(111111, 111111), Range(1, 10**6), Range(2121212118, 2121212124),
+                  Range(473, 36307)]
+        for r in ranges:
+            with self.subTest(r=str(r)):
+                self.assertEqual(sum_all_invalid_ids(r), sum(find_all_invalid_ids(r)))
+
 
 class TestFindAllInvalidIdsPart2Examples(unittest.TestCase):
     """Test Part 2 examples with higher-order repetitions."""
@@ -7,6 +7,11 @@ import argparse
 import sys
 from typing import TextIO
 
+# Byte translation tables for parse_batteries: map ASCII '0'-'9' to the values
+# 0-9 and delete every other byte, so a whole line is parsed in one C call.
+_DIGIT_VALUES = bytes.maketrans(b'0123456789', bytes(range(10)))
+_NON_DIGITS = bytes(c for c in range(256) if not 0x30 <= c <= 0x39)
+
 def max_joltage(batteries: list[int], ndigits: int) -> int:
     """
     Calculate the maximum joltage from a bank of batteries
@@ -25,34 +30,45 @@ def max_joltage(batteries: list[int], ndigits: int) -> int:
     if ndigits > n:
         raise ValueError("ndigits must be less than or equal to the number of batteries")
 
-    max_j = 0
-
-    order = sorted(range(n), key=lambda i: batteries[i], reverse=True)
-    leftmost = -1
-
-    for i in range(ndigits):
-        # find the highest digit further ahead than the leftmost and before or at the rightmost
-        rightmost = n - (ndigits - i)
-        for idx in order:
-            if leftmost < idx and idx <= rightmost:
-                break
-        leftmost = idx
-        max_j = max_j * 10 + batteries[idx]
+    # Corner cases that need no selection: a single digit is just the
+    # largest one, and keeping every digit keeps them all in order.
+    if ndigits == 1:
+        return max(batteries)
+
+    if ndigits == n:
+        selected = batteries
+    else:
+        # Greedy monotonic stack: keep the kept digits in non-increasing order,
+        # popping a smaller digit whenever a larger one arrives and we can still
+        # afford to drop one. Each digit is pushed and popped at most once.
+        to_drop = n - ndigits
+        stack = []
+        pop, push = stack.pop, stack.append
+        for digit in batteries:
+            while to_drop and stack and stack[-1] < digit:
+                pop()
+                to_drop -= 1
+            push(digit)
+        selected = stack[:ndigits]
 
+    max_j = 0
+    for digit in selected:
+        max_j = max_j * 10 + digit
     return max_j
 
 def parse_batteries(line: str) -> list[int]:
     """
     Parse a line of battery digits into a list of integers.
 
+    Any non-digit characters, including surrounding whitespace, are dropped.
+
     Args:
         line: A string of digits, e.g. "389125467"
 
     Returns:
         A list of integers representing the battery digits.
     """
-    line = line.strip()
-    return [int(char) for char in line if char.isdigit()]
+    return list(line.encode().translate(_DIGIT_VALUES, _NON_DIGITS))
 
 
 def get_inputs(fileobj: TextIO) -> list[list[int]]:
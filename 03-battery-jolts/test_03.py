@@ -10,57 +10,25 @@ from day03 import max_joltage, get_inputs, parse_batteries
 class TestMaxJoltage(unittest.TestCase):
     """Test cases for the max_joltage function"""
 
-    def _parse_battery_string(self, s: str) -> list[int]:
-        """Helper method to convert a string of digits to a list of ints"""
-        return [int(d) for d in s]
-
-    def test_example_1_largest_first_two(self):
-        """Test: 987654321111111 → 98"""
-        batteries = self._parse_battery_string("987654321111111")
-        result = max_joltage(batteries, 2)
-        self.assertEqual(result, 98)
-
-    def test_example_2_separated_digits(self):
-        """Test: 811111111111119 → 89"""
-        batteries = self._parse_battery_string("811111111111119")
-        result = max_joltage(batteries, 2)
-        self.assertEqual(result, 89)
-
-    def test_example_3_last_two(self):
-        """Test: 234234234234278 → 78"""
-        batteries = self._parse_battery_string("234234234234278")
-        result = max_joltage(batteries, 2)
-        self.assertEqual(result, 78)
-
-    def test_example_4_complex_pattern(self):
-        """Test: 818181911112111 → 92"""
-        batteries = self._parse_battery_string("818181911112111")
-        result = max_joltage(batteries, 2)
-        self.assertEqual(result, 92)
-
-    def test_example_1_twelve_digits(self):
-        """Test: 987654321111111 → 987654321111 (12 digits)"""
-        batteries = self._parse_battery_string("987654321111111")
-        result = max_joltage(batteries, 12)
-        self.assertEqual(result, 987654321111)
-
-    def test_example_2_twelve_digits(self):
-        """Test: 811111111111119 → 811111111119 (12 digits)"""
-        batteries = self._parse_battery_string("811111111111119")
-        result = max_joltage(batteries, 12)
-        self.assertEqual(result, 811111111119)
-
-    def test_example_3_twelve_digits(self):
-        """Test: 234234234234278 → 434234234278 (12 digits)"""
-        batteries = self._parse_battery_string("234234234234278")
-        result = max_joltage(batteries, 12)
-        self.assertEqual(result, 434234234278)
-
-    def test_example_4_twelve_digits(self):
-        """Test: 818181911112111 → 888911112111 (12 digits)"""
-        batteries = self._parse_battery_string("818181911112111")
-        result = max_joltage(batteries, 12)
-        self.assertEqual(result, 888911112111)
+    # Examples from the problem statement: (bank, ndigits, expected joltage)
+    EXAMPLE_CASES = [
+        ("987654321111111", 2, 98),             # largest first two
+        ("811111111111119", 2, 89),             # separated digits
+        ("234234234234278", 2, 78),             # last two
+        ("818181911112111", 2, 92),             # complex pattern
+        ("987654321111111", 12, 987654321111),
+        ("811111111111119", 12, 811111111119),
+        ("234234234234278", 12, 434234234278),
+        ("818181911112111", 12, 888911112111),
+    ]
+    # Parsed once for the whole class rather than per test
+    EXAMPLE_BANKS = {bank: [int(d) for d in bank] for bank, _, _ in EXAMPLE_CASES}
+
+    def test_examples(self):
+        """Test the examples from the problem statement, for 2 and 12 digits"""
+        for bank, ndigits, expected in self.EXAMPLE_CASES:
+            with self.subTest(bank=bank, ndigits=ndigits):
+                self.assertEqual(max_joltage(self.EXAMPLE_BANKS[bank], ndigits), expected)
 
     def test_single_digit_selection(self):
         """Test selecting only one digit returns the maximum digit"""
@@ -76,7 +44,7 @@ class TestMaxJoltage(unittest.TestCase):
 
     def test_three_digit_selection(self):
         """Test selecting three digits"""
-        batteries = self._parse_battery_string("987654321")
+        batteries = [int(d) for d in "987654321"]
         result = max_joltage(batteries, 3)
         self.assertEqual(result, 987)
 
@@ -92,6 +60,12 @@ class TestMaxJoltage(unittest.TestCase):
         result = max_joltage(batteries, 2)
         self.assertEqual(result, 98)
 
+    def test_many_digits(self):
+        """Test a selection longer than int()'s default string-conversion limit"""
+        batteries = [9] * 5000
+        result = max_joltage(batteries, 4500)
+        self.assertEqual(result, 10 ** 4500 - 1)
+
     def test_order_matters(self):
         """Test that order matters: 91 vs 19"""
         batteries = [1, 9]
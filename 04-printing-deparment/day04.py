@@ -4,20 +4,90 @@ Advent of Code 2025 - Day 4: Printing Department (navigating mazes of rolls of p
 
 """
 import argparse
-from typing import TextIO
+import copy
+from array import array
+from collections import deque
+from typing import Callable, Iterator, TextIO
+
+ROLL = ord('@')
+EMPTY = ord('.')
+BORDER = 0
+
+# Maps roll bytes to 1 and everything else to 0, for counting via sums
+_ROLL_BITS = bytes(int(b == ROLL) for b in range(256))
+
+
+class _PaddedRow:
+    """
+    Read-only view of one row of a flat, border-padded buffer.
+
+    Cells are read straight from the buffer and converted with `convert`
+    one at a time, so [col] is O(1) and always reflects the current map.
+    The view has no __setitem__: writing through it raises TypeError
+    rather than being silently lost.
+    """
+    __slots__ = ('_data', '_start', '_ncols', '_convert')
+
+    def __init__(self, data, start: int, ncols: int, convert: Callable):
+        self._data = data
+        self._start = start
+        self._ncols = ncols
+        self._convert = convert
+
+    def __len__(self) -> int:
+        return self._ncols
+
+    def __getitem__(self, col: int):
+        if not 0 <= col < self._ncols:
+            raise IndexError(f"column {col} out of range")
+        return self._convert(self._data[self._start + col])
+
+    def __iter__(self) -> Iterator:
+        return map(self._convert, self._data[self._start:self._start + self._ncols])
+
+
+class _PaddedView:
+    """
+    Read-only [row][col] view onto one of Map's flat, border-padded buffers.
+
+    Indexing by row returns a _PaddedRow over that row's interior cells; the
+    border is never exposed and nothing is copied.
+    """
+    __slots__ = ('_data', '_width', '_nrows', '_ncols', '_convert')
+
+    def __init__(self, data, width: int, nrows: int, ncols: int, convert: Callable):
+        self._data = data
+        self._width = width
+        self._nrows = nrows
+        self._ncols = ncols
+        self._convert = convert
+
+    def __len__(self) -> int:
+        return self._nrows
+
+    def __getitem__(self, row: int) -> _PaddedRow:
+        if not 0 <= row < self._nrows:
+            raise IndexError(f"row {row} out of range")
+        return _PaddedRow(self._data, (row + 1) * self._width + 1, self._ncols, self._convert)
 
 
 class Map:
     """
     Represents a 2D map of the printing department.
 
+    The map is stored flat, row-major, with a one-cell border all round, so
+    the eight neighbours of any real cell sit at fixed index offsets and need
+    no bounds checks. Cell (row, col) lives at (row+1)*(ncols+2) + (col+1).
+    Cells and accessibility flags take a byte each, and so do neighbour
+    counts, which never exceed eight.
+
     Attributes:
-        grid (list[list[str]]): 2D list representing the map layout.
+        grid (_PaddedView): Read-only [row][col] view of the map layout, one char per cell.
         nrows (int): Number of rows in the grid.
         ncols (int): Number of columns in the grid.
         max_neighbours (int): Maximum number of neighbors for a roll to be accessible.
-        neighbour_count (list[list[int]]): Count of neighboring rolls for each cell.
-        accessible (list[list[bool]]): Whether each cell is currently accessible.
+        neighbour_count (_PaddedView): Read-only [row][col] view of neighbouring roll counts.
+        accessible (_PaddedView): Read-only [row][col] view of whether each cell is accessible.
     """
 
     def __init__(self, lines: list[str], max_neighbours: int = 4):
@@ -25,44 +95,90 @@ class Map:
         Initialize the map from a list of strings.
 
         Args:
-            lines: List of strings representing the map rows.
+            lines: List of strings representing the map rows; surrounding
+                   whitespace is stripped and shorter rows are padded with
+                   empty cells to the width of the first.
             max_neighbours: Maximum number of roll neighbors for accessibility (default: 4).
         """
-        self.grid = [list(line.strip()) for line in lines]
-        self.nrows = len(self.grid)
-        self.ncols = len(self.grid[0]) if self.nrows > 0 else 0
+        lines = [line.strip() for line in lines]
+        self.nrows = len(lines)
+        self.ncols = len(lines[0]) if self.nrows > 0 else 0
+        lines = [line.ljust(self.ncols, chr(EMPTY))[:self.ncols] for line in lines]
         self.max_neighbours = max_neighbours
 
-        self.neighbour_count = [[0 for _ in range(self.ncols)] for _ in range(self.nrows)]
-        self.accessible = [[False for _ in range(self.ncols)] for _ in range(self.nrows)]
-        for r in range(self.nrows):
-            for c in range(self.ncols):
-                self.neighbour_count[r][c] = self.n_neighbours(r, c, tile='@')
-                if self.grid[r][c] == '@' and self.neighbour_count[r][c] < max_neighbours:
-                    self.accessible[r][c] = True
-
-    def __str__(self):
-        """Return string representation of the map."""
-        return '\n'.join(''.join(row) for row in self.grid)
+        width = self.ncols + 2
+        self._width = width
+        self._offsets = (-width - 1, -width, -width + 1, -1, 1, width - 1, width, width + 1)
+
+        # The border is a byte that is neither a roll nor an empty cell, so
+        # n_neighbours never counts it whatever tile is asked for. Two border
+        # bytes between rows close one row and open the next, so the whole
+        # buffer comes from a single join and encode.
+        if lines:
+            edge = bytes([BORDER]) * (width + 1)
+            cells = bytearray(edge + (chr(BORDER) * 2).join(lines).encode() + edge)
+        else:
+            cells = bytearray([BORDER]) * (2 * width)
+        self._cells = cells
+
+        rolls = cells.translate(_ROLL_BITS)
+        counts = array('B', self._neighbour_sums(rolls))
+        self._neighbour_count = counts
+        self._accessible = bytearray(roll and count < max_neighbours for roll, count in zip(rolls, counts))
+
+        self._bind()
+
+    def _bind(self):
+        """Attach the removal kernel and the [row][col] views to the current buffers."""
+        width, nrows, ncols = self._width, self.nrows, self.ncols
+        self._remove_at = self._make_remover()
+        self.grid = _PaddedView(self._cells, width, nrows, ncols, chr)
+        self.neighbour_count = _PaddedView(self._neighbour_count, width, nrows, ncols, int)
+        self.accessible = _PaddedView(self._accessible, width, nrows, ncols, bool)
+
+    def __deepcopy__(self, memo: dict) -> "Map":
+        """
+        Copy the map's buffers, without rebuilding its neighbour counts.
 
-    def _iterate_neighbors(self, row: int, col: int):
+        The removal kernel and the views refer to the buffers they were built
+        over, so they are rebound to the copies.
+        """
+        other = copy.copy(self)
+        other._cells = bytearray(self._cells)
+        other._neighbour_count = array('B', self._neighbour_count)
+        other._accessible = bytearray(self._accessible)
+        other._bind()
+        return other
+
+    def _neighbour_sums(self, bits: bytes) -> list[int]:
         """
-        Generator that yields (r, c) coordinates of all 8 neighboring cells.
+        Sum a 0/1 buffer over the eight neighbours of every cell.
+
+        This is a 3x3 box sum minus the centre cell: sum each horizontal
+        window of three, then add the windows one row above and below (a row
+        is `width` apart, with zero rows beyond the buffer). Border cells get
+        true sums too, so the counts never go negative as rolls are removed.
 
         Args:
-            row: Row index of the center cell.
-            col: Column index of the center cell.
+            bits: Flat padded buffer of 0s and 1s, one byte per cell.
 
-        Yields:
-            Tuple of (row, col) for each valid neighboring cell.
+        Returns:
+            A list of neighbour sums, one per cell of the padded buffer.
         """
-        for dr in [-1, 0, 1]:
-            for dc in [-1, 0, 1]:
-                if dr == 0 and dc == 0:
-                    continue
-                r, c = row + dr, col + dc
-                if 0 <= r < self.nrows and 0 <= c < self.ncols:
-                    yield (r, c)
+        width = self._width
+        window_sums = [0] + [left + mid + right for left, mid, right in zip(bits, bits[1:], bits[2:])] + [0]
+        edge = [0] * width
+        padded = edge + window_sums + edge
+        return [above + level + below - centre
+                for above, level, below, centre in zip(padded, padded[width:], padded[2 * width:], bits)]
+
+    def __str__(self):
+        """Return string representation of the map."""
+        return '\n'.join(''.join(row) for row in self.grid)
+
+    def _index(self, row: int, col: int) -> int:
+        """Return the flat buffer index of cell (row, col)."""
+        return (row + 1) * self._width + col + 1
 
     def n_neighbours(self, row: int, col: int, tile: str = '@') -> int:
         """
@@ -76,11 +192,10 @@ class Map:
         Returns:
             The count of neighboring tiles matching the specified type.
         """
-        count = 0
-        for r, c in self._iterate_neighbors(row, col):
-            if self.grid[r][c] == tile:
-                count += 1
-        return count
+        i = self._index(row, col)
+        target = ord(tile)
+        cells = self._cells
+        return sum(cells[i + offset] == target for offset in self._offsets)
 
     def accessible_cells(self) -> list[tuple[int, int]]:
         """
@@ -89,13 +204,60 @@ class Map:
         Returns:
             A list of (row, col) tuples for all accessible cells.
         """
-        accessible = []
-        for row in range(self.nrows):
-            for col in range(self.ncols):
-                if self.accessible[row][col]:
-                    accessible.append((row, col))
+        width = self._width
+        return [(i // width - 1, i % width - 1) for i, flag in enumerate(self._accessible) if flag]
+
+    def count_accessible(self) -> int:
+        """
+        Count the currently accessible rolls.
+
+        The accessibility flags are built with the map and kept up to date as
+        rolls are removed, so this is a single C-level count over them.
+
+        Returns:
+            The number of rolls with fewer than max_neighbours neighbouring rolls.
+        """
+        return self._accessible.count(1)
+
+    def _make_remover(self) -> Callable[[int, Callable[[int], None] | None], bool]:
+        """
+        Build the roll-removal kernel as a closure over this map's buffers and constants.
+
+        The buffers, offsets and threshold are all fixed once the map is
+        built, so binding them as closure variables saves an attribute lookup
+        on self for each of them on every call. Both remove_roll and
+        removal_batches remove rolls through this one function.
+
+        Returns:
+            A function remove_at(i, on_flip=None) that removes the roll at
+            flat index i, calling on_flip with the index of each neighbouring
+            roll that becomes accessible, and returns whether a roll was removed.
+        """
+        cells = self._cells
+        counts = self._neighbour_count
+        accessible = self._accessible
+        offsets = self._offsets
+        max_neighbours = self.max_neighbours
+
+        def remove_at(i: int, on_flip: Callable[[int], None] | None = None) -> bool:
+            if cells[i] != ROLL:
+                return False
 
-        return accessible
+            cells[i] = EMPTY
+            accessible[i] = False
+
+            # Update neighbor counts and accessibility for neighboring cells
+            for offset in offsets:
+                j = i + offset
+                counts[j] -= 1
+                if counts[j] < max_neighbours and cells[j] == ROLL and not accessible[j]:
+                    accessible[j] = True
+                    if on_flip is not None:
+                        on_flip(j)
+
+            return True
+
+        return remove_at
 
     def remove_roll(self, row: int, col: int) -> bool:
         """
@@ -108,46 +270,60 @@ class Map:
         Returns:
             True if a roll was removed, False if the cell was already empty.
         """
-        if self.grid[row][col] != '@':
-            return False
+        return self._remove_at(self._index(row, col))
+
+    def removal_batches(self) -> Iterator[int]:
+        """
+        Remove accessible rolls round by round, yielding each round's size.
 
-        self.grid[row][col] = '.'
-        self.accessible[row][col] = False
+        Each round removes the rolls that were accessible when it began. Only
+        the cells that crossed the threshold during the previous round are
+        visited: they are queued as they flip, so the map is scanned just
+        once, up front.
 
-        # Update neighbor counts and accessibility for neighboring cells
-        for r, c in self._iterate_neighbors(row, col):
-            self.neighbour_count[r][c] -= 1
-            if self.neighbour_count[r][c] < self.max_neighbours and self.grid[r][c] == '@':
-                self.accessible[r][c] = True
+        Yields:
+            The number of rolls removed in each round, until none are accessible.
+        """
+        remove_at = self._remove_at
 
-        return True
+        batch = deque(i for i, flag in enumerate(self._accessible) if flag)
+        while batch:
+            # Cells flipped during this round wait for the next one
+            next_batch = deque()
+            push = next_batch.append
+            for i in batch:
+                remove_at(i, push)
+
+            yield len(batch)
+            batch = next_batch
+
+    def remove_all_accessible(self) -> int:
+        """
+        Keep removing accessible rolls until none are left accessible.
+
+        Returns:
+            The total number of rolls removed.
+        """
+        return sum(self.removal_batches())
 
 
 def get_inputs(fileobj: TextIO) -> list[str]:
     """
     Read and parse map data from a 2D text file.
 
-    Reads lines from the file, where each line contains a string of map
-    cells, either '@' (roll of paper) or '.' (empty space).
+    Reads the file, where each line contains a string of map cells,
+    either '@' (roll of paper) or '.' (empty space).
 
     Empty lines are skipped.
 
     Args:
-        fileobj: A file-like object (or any iterator of strings) containing
-                 map data, one row per line.
+        fileobj: A file-like object containing map data, one row per line.
 
     Returns:
         A list of strings representing the map rows.
     """
-    lines = []
-    for line in fileobj:
-        line = line.strip()
-        if not line:
-            continue
-
-        lines.append(line)
-
-    return lines
+    # One read and one C-level split, rather than iterating line by line
+    return [line for line in map(str.strip, fileobj.read().splitlines()) if line]
 
 
 def main():
@@ -163,18 +339,10 @@ def main():
     printing_map = Map(input_lines)
 
     print("Part 1")
-    accessible = printing_map.accessible_cells()
-    print(len(accessible))
+    print(printing_map.count_accessible())
 
     print("Part 2")
-    n_removed = 0
-    while accessible:
-        for (r, c) in accessible:
-            printing_map.remove_roll(r, c)
-        n_removed += len(accessible)
-        accessible = printing_map.accessible_cells()
-
-    print(n_removed)
+    print(printing_map.remove_all_accessible())
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
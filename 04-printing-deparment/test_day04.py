@@ -2,6 +2,7 @@
 """
 Tests for Advent of Code 2025 - Day 4: Printing Department
 """
+import copy
 import unittest
 from day04 import Map
 
@@ -23,6 +24,11 @@ class TestPrintingDepartment(unittest.TestCase):
         "@.@.@@@.@.",
     ]
 
+    @classmethod
+    def setUpClass(cls):
+        """Build the example map once; tests that modify it take a deep copy."""
+        cls._template = Map(cls.EXAMPLE_MAP)
+
     def test_example_accessible_rolls(self):
         """
         Test the example from the problem statement.
@@ -59,7 +65,7 @@ class TestPrintingDepartment(unittest.TestCase):
             (9, 0), (9, 2), (9, 8),                   # Row 9: x.x.@@@.x.
         ]
 
-        map_obj = Map(self.EXAMPLE_MAP)
+        map_obj = self._template
         accessible = map_obj.accessible_cells()
 
         # Check the exact coordinates (order doesn't matter, so convert to sets)
@@ -68,11 +74,26 @@ class TestPrintingDepartment(unittest.TestCase):
                         f"Expected: {sorted(expected_accessible)}\n"
                         f"Got: {sorted(accessible)}")
 
+    def test_count_accessible_matches_accessible_cells(self):
+        """
+        Test the accessible count agrees with listing accessible cells, for various thresholds.
+        """
+        for max_neighbours in range(10):
+            map_obj = Map(self.EXAMPLE_MAP, max_neighbours=max_neighbours)
+            self.assertEqual(map_obj.count_accessible(), len(map_obj.accessible_cells()),
+                             f"Mismatch for max_neighbours={max_neighbours}")
+
+        map_obj = copy.deepcopy(self._template)
+        self.assertEqual(map_obj.count_accessible(), 13)
+        for r, c in map_obj.accessible_cells():
+            map_obj.remove_roll(r, c)
+        self.assertEqual(map_obj.count_accessible(), 12)
+
     def test_example_specific_cells(self):
         """
         Test specific cells to verify the neighbor counting logic.
         """
-        map_obj = Map(self.EXAMPLE_MAP)
+        map_obj = self._template
 
         # Test a few specific cells
         # (0, 2) should be accessible: @ with 3 neighbors: (0,3), (1,1), (1,2)
@@ -87,6 +108,41 @@ class TestPrintingDepartment(unittest.TestCase):
         self.assertEqual(map_obj.n_neighbours(1, 0), 3,
                         "Cell (1,0) should have 3 neighbors")
 
+    def test_neighbour_count_matches_n_neighbours(self):
+        """
+        Test the precomputed neighbour counts agree with counting each cell directly.
+        """
+        map_obj = self._template
+        for r in range(map_obj.nrows):
+            for c in range(map_obj.ncols):
+                self.assertEqual(map_obj.neighbour_count[r][c], map_obj.n_neighbours(r, c),
+                                 f"Neighbour count mismatch at ({r},{c})")
+
+    def test_views_are_live_and_read_only(self):
+        """
+        Test the [row][col] views track removals and reject writes.
+        """
+        map_obj = Map(["@@", "@@"])
+        row = map_obj.grid[0]
+        self.assertEqual(''.join(row), "@@")
+        map_obj.remove_roll(0, 1)
+        self.assertEqual(row[1], '.')
+        self.assertEqual(map_obj.neighbour_count[1][0], 2)
+        with self.assertRaises(TypeError):
+            map_obj.accessible[0][0] = False
+        with self.assertRaises(IndexError):
+            map_obj.grid[0][2]
+
+    def test_deepcopy_is_independent(self):
+        """
+        Test removing rolls from a deep copy leaves the original map untouched.
+        """
+        map_obj = copy.deepcopy(self._template)
+        self.assertEqual(map_obj.remove_all_accessible(), 43)
+        self.assertEqual(str(self._template), "\n".join(self.EXAMPLE_MAP))
+        self.assertEqual(self._template.count_accessible(), 13)
+        self.assertEqual(map_obj.count_accessible(), 0)
+
     def test_edge_cases(self):
         """
         Test edge cases like corners and single rolls.
@@ -121,6 +177,15 @@ class TestPrintingDepartment(unittest.TestCase):
         self.assertIn((2, 0), accessible)
         self.assertIn((2, 2), accessible)
 
+        # Ragged rows are padded with empty cells to the first row's width,
+        # and longer rows are cut to it
+        ragged = Map(["@@@", "@", "@@@@"])
+        self.assertEqual(str(ragged), "@@@\n@..\n@@@")
+        self.assertEqual(ragged.neighbour_count[1][2], 4)
+
+        # Surrounding whitespace is not part of the map
+        self.assertEqual(str(Map(["  @@ \n", "@.\n"])), "@@\n@.")
+
     def test_remove_roll_basic(self):
         """
         Test basic remove_roll functionality.
@@ -205,7 +270,7 @@ class TestPrintingDepartment(unittest.TestCase):
         According to the problem, removing accessible rolls repeatedly should
         remove rolls in batches: 13, 12, 7, 5, 2, 1, 1, 1, 1 for a total of 43.
         """
-        map_obj = Map(self.EXAMPLE_MAP)
+        map_obj = copy.deepcopy(self._template)
 
         # Track the number removed in each iteration
         removed_per_iteration = []
@@ -234,6 +299,32 @@ class TestPrintingDepartment(unittest.TestCase):
         self.assertEqual(total_removed, expected_total,
                         f"Expected to remove {expected_total} rolls total, got {total_removed}")
 
+    def test_example_removal_batches(self):
+        """
+        Test batch removal rounds match the per-roll removal sequence.
+        """
+        map_obj = copy.deepcopy(self._template)
+        self.assertEqual(list(map_obj.removal_batches()), [13, 12, 7, 5, 2, 1, 1, 1, 1])
+        self.assertEqual(map_obj.accessible_cells(), [])
+        for r in range(map_obj.nrows):
+            for c in range(map_obj.ncols):
+                self.assertEqual(map_obj.neighbour_count[r][c], map_obj.n_neighbours(r, c),
+                                 f"Neighbour count mismatch at ({r},{c})")
+
+    def test_example_remove_all_accessible(self):
+        """
+        Test draining the map in one go removes the same 43 rolls as the rounds do.
+        """
+        by_rounds = copy.deepcopy(self._template)
+        while accessible := by_rounds.accessible_cells():
+            for r, c in accessible:
+                by_rounds.remove_roll(r, c)
+
+        map_obj = copy.deepcopy(self._template)
+        self.assertEqual(map_obj.remove_all_accessible(), 43)
+        self.assertEqual(str(map_obj), str(by_rounds))
+        self.assertEqual(map_obj.remove_all_accessible(), 0)
+
     def test_small_iterative_removal(self):
         """
         Test iterative removal on a smaller, simpler example.
@@ -4,12 +4,17 @@ Advent of Code 2025 - Day 5: Cafeteria inventory freshness
 """
 
 import argparse
+from array import array
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
 from typing import TextIO
 
 class Range:
     """Represents an inclusive range of integers [start, end].
        From Day 2: Gift Shop IDs."""
 
+    __slots__ = ('start', 'end')
+
     def __init__(self, start: int, end: int):
         """
         Initialize a Range.
@@ -26,6 +31,14 @@ class Range:
         self.start = start
         self.end = end
 
+    @classmethod
+    def _unchecked(cls, start: int, end: int) -> "Range":
+        """Construct a Range from bounds already known to satisfy start <= end."""
+        r = cls.__new__(cls)
+        r.start = start
+        r.end = end
+        return r
+
     @classmethod
     def from_tuple(cls, t: tuple[int, int]) -> "Range":
         """Alternate constructor from (start, end)."""
@@ -34,16 +47,15 @@ class Range:
     @classmethod
     def from_str(cls, s: str, sep: str = '-') -> "Range":
         """Alternate constructor from a string like '11-22'."""
-        start_str, end_str = s.split(sep)
+        start_str, _, end_str = s.partition(sep)
         return cls(int(start_str), int(end_str))
 
     @classmethod
     def valid_str(cls, s: str, sep: str = '-') -> bool:
-        parts = s.split(sep)
-        if len(parts) != 2:
+        start_str, found, end_str = s.partition(sep)
+        if not found:
             return False
         try:
-            start_str, end_str = parts
             return int(start_str) <= int(end_str)
         except ValueError:
             return False
@@ -106,24 +118,112 @@ class Range:
         """
         if not self.overlaps(other):
             raise ValueError("Ranges do not overlap and cannot be merged.")
-        return Range(min(self.start, other.start), max(self.end, other.end))
+        return Range._unchecked(min(self.start, other.start), max(self.end, other.end))
 
     def length(self) -> int:
         """Return the length of the range."""
         return self.end - self.start + 1
 
-def contained_in_ranges(value: int, ranges: list[Range]) -> bool:
+class RangeIndex:
+    """
+    A set of ranges merged once into sorted, disjoint bounds, for fast lookups.
+
+    The merged starts and ends are kept as two parallel arrays of 64-bit
+    ints, so a membership test is one binary search rather than a scan of
+    every range.
+
+    Attributes:
+        starts (array): Start of each merged range (inclusive), increasing.
+        ends (array): End of each merged range (inclusive), increasing.
+    """
+
+    __slots__ = ('starts', 'ends')
+
+    def __init__(self, ranges: list[Range]):
+        """
+        Build the index from a list of ranges, which may overlap.
+
+        Args:
+            ranges: A list of Range objects.
+        """
+        starts, ends = merge_bounds([r.start for r in ranges], [r.end for r in ranges])
+        self.starts = array('q', starts)
+        self.ends = array('q', ends)
+
+    def __len__(self) -> int:
+        """Return the number of merged ranges."""
+        return len(self.starts)
+
+    def __contains__(self, value: int) -> bool:
+        """Check if a value lies in any of the indexed ranges."""
+        # Last range starting at or before value; it holds value iff it ends by then
+        i = bisect_right(self.starts, value) - 1
+        return i >= 0 and self.ends[i] >= value
+
+    def count(self, values: list[int]) -> int:
+        """
+        Count how many of a batch of values lie in the indexed ranges.
+
+        The values are sorted once, then each merged range counts the values
+        between its bounds with two binary searches, so the work is one C
+        sort plus O(R log V) rather than a lookup per value.
+
+        Args:
+            values: The integers to check.
+        Returns:
+            The number of values contained in some range.
+        """
+        ordered = sorted(values)
+        return sum(bisect_right(ordered, end) - bisect_left(ordered, start)
+                   for start, end in zip(self.starts, self.ends))
+
+def contained_in_ranges(value: int, ranges: list[Range] | RangeIndex) -> bool:
     """
     Check if a value is contained in any of the given ranges.
 
+    A list of Range objects is scanned in turn. For repeated queries, build
+    a RangeIndex once and pass that instead; each lookup is then a binary
+    search.
+
     Args:
         value: The integer to check.
-        ranges: A list of Range objects.
+        ranges: A list of Range objects, or a RangeIndex.
     Returns:
         True if the value is contained in any range, False otherwise.
     """
+    if isinstance(ranges, RangeIndex):
+        return value in ranges
+
     return any(r.contains(value) for r in ranges)
 
+def merge_bounds(starts: list[int], ends: list[int]) -> tuple[list[int], list[int]]:
+    """
+    Merge overlapping ranges held as two parallel lists of bounds.
+
+    Keeping starts and ends as plain int lists avoids an object per range.
+    After sorting by start, a running maximum of the ends (itertools.accumulate,
+    in C) gives how far each prefix of ranges reaches; a new merged range
+    begins wherever a range starts beyond that reach.
+
+    Args:
+        starts: Start of each range (inclusive).
+        ends: End of each range (inclusive), parallel to starts.
+    Returns:
+        A tuple of (starts, ends) for the merged ranges, sorted and disjoint.
+    """
+    if not starts:
+        return [], []
+
+    sorted_starts, sorted_ends = zip(*sorted(zip(starts, ends)))
+    reach = list(accumulate(sorted_ends, max))
+
+    # Overlapping (or touching) ranges stay in the current run
+    breaks = [i for i, (start, prev_reach) in enumerate(zip(sorted_starts[1:], reach), 1) if start > prev_reach]
+
+    merged_starts = [sorted_starts[0]] + [sorted_starts[i] for i in breaks]
+    merged_ends = [reach[i - 1] for i in breaks] + [reach[-1]]
+    return merged_starts, merged_ends
+
 def merge_ranges(ranges: list[Range]) -> list[Range]:
     """
     Merge overlapping ranges in a list.
@@ -133,22 +233,8 @@ def merge_ranges(ranges: list[Range]) -> list[Range]:
     Returns:
         A new list of Range objects with overlapping ranges merged.
     """
-    if not ranges:
-        return []
-
-    # Sort ranges by start value
-    sorted_ranges = sorted(ranges)
-    merged = [sorted_ranges[0]]
-
-    for current in sorted_ranges[1:]:
-        last_merged = merged[-1]
-        if last_merged.overlaps(current):
-            # Merge overlapping ranges
-            merged[-1] = last_merged.merge(current)
-        else:
-            merged.append(current)
-
-    return merged
+    starts, ends = merge_bounds([r.start for r in ranges], [r.end for r in ranges])
+    return [Range._unchecked(start, end) for start, end in zip(starts, ends)]
 
 def get_inputs(fileobj: TextIO) -> tuple[list[Range], list[int]]:
     """
@@ -166,15 +252,21 @@ def get_inputs(fileobj: TextIO) -> tuple[list[Range], list[int]]:
     """
     ranges = []
     values = []
-    for line in fileobj:
+    for line in fileobj.read().splitlines():
         line = line.strip()
         if not line:
             continue
 
-        if Range.valid_str(line):
-            ranges.append(Range.from_str(line))
-        else:
-            values.append(int(line))
+        # Parse each range once, rather than validating and then parsing again
+        start_str, found, end_str = line.partition('-')
+        if found:
+            try:
+                ranges.append(Range(int(start_str), int(end_str)))
+                continue
+            except ValueError:
+                pass
+
+        values.append(int(line))
 
     return ranges, values
 
@@ -185,15 +277,15 @@ def main():
     args = parser.parse_args()
 
     ranges, values = get_inputs(args.input_file)
-    ranges = merge_ranges(ranges)
+    index = RangeIndex(ranges)
 
-    fresh_count = sum(1 for v in values if contained_in_ranges(v, ranges))
+    fresh_count = index.count(values)
 
     print("Part 1")
     print(fresh_count)
 
     print("Part 2")
-    total_length = sum(r.length() for r in ranges)
+    total_length = sum(index.ends) - sum(index.starts) + len(index)
     print(total_length)
 
          
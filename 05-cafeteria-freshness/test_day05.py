@@ -5,7 +5,7 @@ Unit tests for Advent of Code 2025 - Day 5: Cafeteria inventory freshness
 
 import unittest
 import io
-from day05 import Range, contained_in_ranges, get_inputs, merge_ranges
+from day05 import Range, RangeIndex, contained_in_ranges, get_inputs, merge_bounds, merge_ranges
 
 
 class TestRange(unittest.TestCase):
@@ -353,6 +353,24 @@ class TestContainedInRanges(unittest.TestCase):
         """Test with empty ranges list."""
         self.assertFalse(contained_in_ranges(5, []))
 
+    def test_range_index_lookup(self):
+        """Test lookups through a RangeIndex agree with the list scan."""
+        index = RangeIndex(self.ranges)
+        self.assertEqual(len(index), 2)  # 3-5 and 10-20
+        for value in range(0, 25):
+            self.assertEqual(contained_in_ranges(value, index), contained_in_ranges(value, self.ranges),
+                             f"Mismatch for value {value}")
+        self.assertFalse(contained_in_ranges(5, RangeIndex([])))
+
+    def test_range_index_count(self):
+        """Test counting a batch of values agrees with checking each one."""
+        index = RangeIndex(self.ranges)
+        values = [17, 1, 5, 32, 8, 11, 5, 20, 21, 3]
+        expected = sum(1 for v in values if contained_in_ranges(v, self.ranges))
+        self.assertEqual(index.count(values), expected)
+        self.assertEqual(index.count([]), 0)
+        self.assertEqual(RangeIndex([]).count(values), 0)
+
     def test_example_from_problem(self):
         """Test all values from the problem example."""
         # From problem: "3 of the available ingredient IDs are fresh"
@@ -567,6 +585,7 @@ class TestIntegration(unittest.TestCase):
 
         # Should be 3 fresh ingredients (5, 11, 17)
         self.assertEqual(fresh_count, 3)
+        self.assertEqual(RangeIndex(ranges).count(values), 3)
 
     def test_full_example_part2(self):
         """Test the complete example from the problem - Part 2."""
@@ -598,6 +617,11 @@ class TestIntegration(unittest.TestCase):
         # 3-5 has length 3, 10-20 has length 11, total = 14
         self.assertEqual(total_length, 14)
 
+        # Same again from parallel lists of bounds
+        starts, ends = merge_bounds([r.start for r in ranges], [r.end for r in ranges])
+        self.assertEqual((starts, ends), ([3, 10], [5, 20]))
+        self.assertEqual(sum(ends) - sum(starts) + len(starts), 14)
+
 
 if __name__ == '__main__':
     unittest.main()
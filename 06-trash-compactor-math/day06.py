@@ -5,11 +5,10 @@ Refactored for improved testability
 """
 
 import argparse
-from typing import TextIO
+from typing import Iterable, Iterator, TextIO
 from enum import Enum
-import re
+import math
 import operator
-from functools import reduce
 
 
 class Operation(Enum):
@@ -19,15 +18,15 @@ class Operation(Enum):
     @classmethod
     def from_str(cls, s: str) -> "Operation":
         """Alternate constructor from a string like '+' or '*'."""
-        for op in cls:
-            if op.value == s:
-                return op
-        raise ValueError(f"Invalid operation string: {s}")
+        try:
+            return _SYMBOL_TO_OPERATION[s]
+        except KeyError:
+            raise ValueError(f"Invalid operation string: {s}") from None
 
     @classmethod
     def valid_str(cls, s: str) -> bool:
         """Check if a string is a valid operation."""
-        return any(op.value == s for op in cls)
+        return s in _SYMBOL_TO_OPERATION
 
     @classmethod
     def values_list(cls) -> list[str]:
@@ -36,15 +35,28 @@ class Operation(Enum):
 
     def operator(self):
         """Return the corresponding operator function."""
-        ops = {
-            Operation.ADD: operator.add,
-            Operation.MULTIPLY: operator.mul,
-        }
-        return ops[self]
+        return _OPERATOR_FUNCS[self]
 
     def apply(self, values: list[int]) -> int:
         """Apply the operation to a list of integers."""
-        return reduce(self.operator(), values)
+        return _REDUCERS[self](values)
+
+
+# Built once, rather than on every Operation.operator() call
+_OPERATOR_FUNCS = {
+    Operation.ADD: operator.add,
+    Operation.MULTIPLY: operator.mul,
+}
+
+# Symbol lookups, so parsing does not scan the enum members per call
+_SYMBOL_TO_OPERATION = {op.value: op for op in Operation}
+_VALID_OPS = frozenset(_SYMBOL_TO_OPERATION)
+
+# Whole-list equivalents of folding with _OPERATOR_FUNCS, each one C loop
+_REDUCERS = {
+    Operation.ADD: sum,
+    Operation.MULTIPLY: math.prod,
+}
 
 
 def find_operator_positions(operation_line: str) -> list[tuple[int, str]]:
@@ -57,8 +69,7 @@ def find_operator_positions(operation_line: str) -> list[tuple[int, str]]:
     Returns:
         List of (position, operator) tuples where position is the column index
     """
-    valid_ops = Operation.values_list()
-    return [(i, char) for i, char in enumerate(operation_line) if char in valid_ops]
+    return [(i, char) for i, char in enumerate(operation_line) if char in _VALID_OPS]
 
 
 def determine_column_boundaries(operator_positions: list[tuple[int, str]], max_width: int) -> list[tuple[int, int]]:
@@ -111,44 +122,44 @@ def parse_column(column_lines: list[str], cephalopod: bool) -> list[int]:
     Returns:
         List of integer values found in the column
     """
-    values = []
-
     if cephalopod:
         # Transpose: each character position becomes a vertical number
         # Example: ['64 ', '23 ', '314'] → ['623', '431', '4']
-        column_lines = [''.join(chars) for chars in zip(*column_lines)]
-
-    for line in column_lines:
-        line = line.strip()
-        if not line:
-            continue
-
-        if re.match(r'^\d+$', line):
-            values.append(int(line))
+        # Pad once on entry so zip() doesn't truncate to the shortest line
+        width = max(map(len, column_lines), default=0)
+        column_lines = [''.join(chars) for chars in zip(*(line.ljust(width) for line in column_lines))]
 
-    return values
+    # isdecimal() accepts exactly what \d+ would, without the regex engine;
+    # blank lines strip to '' which isn't decimal, so one filter skips both
+    return list(map(int, filter(str.isdecimal, map(str.strip, column_lines))))
 
 
-def parse_worksheet(text: str, cephalopod: bool=False) -> list[tuple[list[int], Operation]]:
+def iter_problems(text: str, cephalopod: bool=False) -> Iterator[tuple[list[int], Operation]]:
     """
-    Parse worksheet text into problems, preserving column alignment.
+    Parse worksheet text into problems one at a time, preserving column alignment.
 
     The last line contains operators that mark the start of each column.
     Columns extend from each operator position to just before the next operator.
+    Each problem is yielded as soon as its column is parsed, so a consumer
+    such as calculate_grand_total can reduce it before the next is extracted.
 
     Args:
         text: The full worksheet text
         cephalopod: If True, parse in cephalopod mode (transpose columns to read
                    character positions vertically)
 
-    Returns:
-        List of (values, operation) tuples, one per problem
+    Yields:
+        (values, operation) tuples, one per problem
+
+    Raises:
+        ValueError: If the worksheet has no operators (on the first next()).
     """
-    # Read lines without stripping (preserve spacing!)
-    lines = [line.rstrip('\n') for line in text.split('\n') if line.strip()]
+    # Read lines without stripping (preserve spacing!); splitlines already
+    # drops the line endings, so one pass builds the list
+    lines = [line for line in text.splitlines() if line.strip()]
 
     if not lines:
-        return []
+        return
 
     # Last line contains the operations
     operation_line = lines[-1]
@@ -164,21 +175,41 @@ def parse_worksheet(text: str, cephalopod: bool=False) -> list[tuple[list[int],
     max_width = max(len(line) for line in lines)
     column_boundaries = determine_column_boundaries(operator_positions, max_width)
 
+    if cephalopod:
+        # Pad the value lines to a common width and join them into one string;
+        # character column j of the whole sheet is then the strided slice
+        # sheet[j::max_width], so no per-problem zip/join transpose is needed
+        sheet = ''.join(line.ljust(max_width) for line in value_lines)
+
     # Extract and parse each column
-    problems = []
     for (start, end), (_, op_char) in zip(column_boundaries, operator_positions):
-        # Extract this column from all value lines
-        column_lines = [line[start:end] if start < len(line) else '' for line in value_lines]
-
-        # Parse the values
-        values = parse_column(column_lines, cephalopod)
+        if cephalopod:
+            # Each character position in this column, read top to bottom
+            values = parse_column([sheet[j::max_width] for j in range(start, end)], cephalopod=False)
+        else:
+            # Extract this column from all value lines
+            column_lines = [line[start:end] if start < len(line) else '' for line in value_lines]
+            values = parse_column(column_lines, cephalopod)
 
         # Create the operation
         operation = Operation.from_str(op_char)
 
-        problems.append((values, operation))
+        yield values, operation
+
+
+def parse_worksheet(text: str, cephalopod: bool=False) -> list[tuple[list[int], Operation]]:
+    """
+    Parse worksheet text into a list of problems; see iter_problems.
+
+    Args:
+        text: The full worksheet text
+        cephalopod: If True, parse in cephalopod mode (transpose columns to read
+                   character positions vertically)
 
-    return problems
+    Returns:
+        List of (values, operation) tuples, one per problem
+    """
+    return list(iter_problems(text, cephalopod=cephalopod))
 
 
 def get_inputs(fileobj: TextIO, cephalopod: bool=False) -> list[tuple[list[int], Operation]]:
@@ -197,8 +228,8 @@ def get_inputs(fileobj: TextIO, cephalopod: bool=False) -> list[tuple[list[int],
     return parse_worksheet(text, cephalopod=cephalopod)
 
 
-def calculate_grand_total(problems: list[tuple[list[int], Operation]]) -> int:
-    """Calculate the sum of all problem results."""
+def calculate_grand_total(problems: Iterable[tuple[list[int], Operation]]) -> int:
+    """Calculate the sum of all problem results, from a list or an iterator."""
     return sum(op.apply(vals) for vals, op in problems)
 
 
@@ -210,12 +241,10 @@ def main():
     worksheet = args.input_file.read()
 
     print("Part 1")
-    problems = parse_worksheet(worksheet, cephalopod=False)
-    print(calculate_grand_total(problems))
+    print(calculate_grand_total(iter_problems(worksheet, cephalopod=False)))
 
     print("Part 2")
-    problems = parse_worksheet(worksheet, cephalopod=True)
-    print(calculate_grand_total(problems))
+    print(calculate_grand_total(iter_problems(worksheet, cephalopod=True)))
 
 
 if __name__ == '__main__':
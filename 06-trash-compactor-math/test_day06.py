@@ -11,6 +11,7 @@ from day06 import (
     determine_column_boundaries,
     parse_column,
     parse_worksheet,
+    iter_problems,
     get_inputs,
     calculate_grand_total,
 )
@@ -181,6 +182,12 @@ class TestParseColumn(unittest.TestCase):
         # After transpose: pos 0: '623', pos 1: '431', pos 2: '4'
         self.assertEqual(result, [623, 431, 4])
 
+    def test_parse_cephalopod_mode_ragged(self):
+        """Test cephalopod mode pads short lines rather than truncating"""
+        column_lines = ["64", "23 ", "314"]
+        result = parse_column(column_lines, cephalopod=True)
+        self.assertEqual(result, [623, 431, 4])
+
 
 class TestParseWorksheet(unittest.TestCase):
     """Tests for parse_worksheet function"""
@@ -266,6 +273,12 @@ class TestParseWorksheet(unittest.TestCase):
         self.assertEqual(op, Operation.ADD)
         self.assertEqual(op.apply(vals), 1058)
 
+    def test_parse_cephalopod_ragged_lines(self):
+        """Test cephalopod mode treats characters missing from short lines as spaces"""
+        text = "12 3\n4\n+  *"
+        result = parse_worksheet(text, cephalopod=True)
+        self.assertEqual(result, [([14, 2], Operation.ADD), ([3], Operation.MULTIPLY)])
+
 
 class TestGetInputs(unittest.TestCase):
     """Integration tests for get_inputs function"""
@@ -308,6 +321,12 @@ class TestGetInputs(unittest.TestCase):
         grand_total = calculate_grand_total(problems)
         self.assertEqual(grand_total, 4277556)
 
+    def test_grand_total_from_iter_problems(self):
+        """Test the grand totals can be reduced straight from the problem iterator"""
+        self.assertEqual(calculate_grand_total(iter_problems(EXAMPLE_WORKSHEET)), 4277556)
+        self.assertEqual(calculate_grand_total(iter_problems(EXAMPLE_WORKSHEET_CEPHALOPOD, cephalopod=True)),
+                         3263827)
+
     def test_get_inputs_cephalopod_grand_total(self):
         """Test that the cephalopod mode grand total matches the example (Part 2)"""
         fileobj = StringIO(EXAMPLE_WORKSHEET_CEPHALOPOD)
@@ -4,9 +4,13 @@ Advent of Code 2025 - Day 7: Tachyon Splitting in the Laboratory
 
 """
 import argparse
-from typing import TextIO
+from array import array
+from bisect import bisect_right
+from functools import lru_cache
+from itertools import accumulate
+from typing import Iterator, TextIO
 from enum import Enum
-from collections import namedtuple, defaultdict
+from collections import namedtuple
 
 Point = namedtuple("Point", ["row", "col"])
 Path = namedtuple("Path", ["start", "end"])
@@ -18,15 +22,175 @@ class MapCell(Enum):
 
     @classmethod
     def from_str(cls, s: str) -> "MapCell":
-        for cell in cls:
-            if cell.value == s:
-                return cell
-        raise ValueError(f"Invalid cell string: {s}")
+        try:
+            return _CELLS_BY_STR[s]
+        except KeyError:
+            raise ValueError(f"Invalid cell string: {s}") from None
 
     def to_str(self) -> str:
         return self.value
 
 
+# Character lookup, so from_str does not scan the enum members per call
+_CELLS_BY_STR = {cell.value: cell for cell in MapCell}
+
+# Grid bytes that are not empty cells, and a translation table that shows
+# every other byte as empty
+_CELLS_BY_BYTE = {ord(cell.value): cell for cell in MapCell if cell is not MapCell.EMPTY}
+_DISPLAY_CHARS = bytes(b if b in _CELLS_BY_BYTE else ord(MapCell.EMPTY.value) for b in range(256))
+
+
+def _find_cells(grid: bytes, cell: MapCell) -> Iterator[int]:
+    """Yield the flat index of every cell of the given type, using bytes.find."""
+    target = cell.value.encode()
+    i = grid.find(target)
+    while i != -1:
+        yield i
+        i = grid.find(target, i + 1)
+
+
+def _index_splitters(grid: bytes, ncols: int) -> tuple[array, array]:
+    """
+    Collect the splitter rows in each column of a row-major grid.
+
+    The rows are stored column by column in one flat array, so column c's
+    splitter rows are rows[col_start[c]:col_start[c + 1]] (compressed sparse
+    column layout), and can be searched in place with bisect's lo/hi bounds.
+    The grid is scanned in row-major order and placed with a stable counting
+    sort by column, so each column's rows come out in increasing order.
+
+    Returns:
+        Tuple of (col_start, rows), arrays of ncols + 1 and nsplitters ints.
+    """
+    positions = [divmod(i, ncols) for i in _find_cells(grid, MapCell.SPLITTER)]
+
+    counts = array('i', [0]) * (ncols + 1)
+    for _, col in positions:
+        counts[col + 1] += 1
+    col_start = array('i', accumulate(counts))
+
+    rows = array('i', [0]) * len(positions)
+    next_slot = col_start[:-1]
+    for row, col in positions:
+        rows[next_slot[col]] = row
+        next_slot[col] += 1
+    return col_start, rows
+
+
+def _pack_point(row: int, col: int, width: int) -> int:
+    """
+    Pack a point into a single int, in row-major order.
+
+    Columns from -1 (just off the left edge) to width - 2 are representable,
+    so with width = ncols + 2 every point a beam can reach packs uniquely,
+    and packed points sort exactly as (row, col) tuples do.
+    """
+    return row * width + col + 1
+
+
+def _unpack_point(key: int, width: int) -> Point:
+    """Inverse of _pack_point."""
+    row, col = divmod(key, width)
+    return Point(row, col - 1)
+
+
+def _propagate_rays(col_start: array, splitter_rows: array, nrows: int, ncols: int,
+                    sources: tuple[tuple[int, int], ...]) -> tuple[set[int], array]:
+    """
+    Trace tachyon rays down the map from every source at once, on plain ints.
+
+    This is the loop behind Map.propagate. Points are packed into single
+    ints (see _pack_point, with width ncols + 2), which hash and compare
+    without allocating a tuple per point, and everything the loop needs is
+    held in locals. Building Point and Path objects is left to the caller.
+
+    Segments are appended to one flat array of ints rather than hashed into
+    a set. A ray start reached twice (two splitters feeding the same cell)
+    would only retrace segments already recorded, so it is only pushed the
+    first time, which keeps the segments unique and the stack short. Rays
+    from different sources share one stack, so where their beams meet they
+    merge just as split beams do.
+
+    Args:
+        col_start: Offset of each column's rows in splitter_rows, plus the total.
+        splitter_rows: Sorted splitter rows for each column, concatenated.
+        nrows: Number of rows in the map.
+        ncols: Number of columns in the map.
+        sources: (row, col) of each source.
+
+    Returns:
+        Tuple of (splitters_hit, segments) where:
+            - splitters_hit: Set of packed points of splitters encountered
+            - segments: Flat array of start_row, start_col, end_row, end_col,
+              four ints per beam segment
+    """
+    width = ncols + 2
+    splitters_hit: set[int] = set()
+    segments = array('i')
+    add_segment = segments.extend
+
+    # Every packed point at or past this is below the last row
+    past_bottom = nrows * width
+
+    active_rays = [_pack_point(row, col, width) for row, col in sources]
+    scheduled = set(active_rays)
+    pop, push = active_rays.pop, active_rays.append
+    while active_rays:
+        start = pop()
+
+        # Skip if off the map (bottom, left, or right). The bottom check is one
+        # compare on the packed int; a packed column of 0 or ncols + 1 is the
+        # padding either side of the map
+        if start >= past_bottom:
+            continue
+        r, c = divmod(start, width)
+        if not 0 < c <= ncols:
+            continue
+        c -= 1
+
+        end = col_start[c + 1]
+        i = bisect_right(splitter_rows, r, col_start[c], end)
+        if i == end:
+            # No splitters below in this column, ray exits the map
+            add_segment((r, c, nrows, c))
+            continue
+
+        splitter_row = splitter_rows[i]
+        add_segment((r, c, splitter_row, c))
+
+        splitter_pos = splitter_row * width + c + 1
+        if splitter_pos in splitters_hit:
+            # This splitter has already been hit, ray is absorbed
+            continue
+
+        splitters_hit.add(splitter_pos)
+
+        # Create two new beams going left and right, one row down
+        add_segment((splitter_row, c, splitter_row + 1, c - 1, splitter_row, c, splitter_row + 1, c + 1))
+        below = splitter_pos + width
+        # Push each new ray start once; a repeat would retrace the same segments
+        for ray in (below - 1, below + 1):
+            if ray not in scheduled:
+                scheduled.add(ray)
+                push(ray)
+
+    return splitters_hit, segments
+
+
+@lru_cache(maxsize=8)
+def _propagate_cached(grid: bytes, nrows: int, ncols: int,
+                      sources: tuple[tuple[int, int], ...]) -> tuple[frozenset[int], tuple[int, ...]]:
+    """
+    Memoized _propagate_rays, keyed on the grid contents and the sources.
+
+    Maps built from the same input (e.g. by calling get_inputs twice on one
+    file) share a result, so repeat propagations are a cache lookup. The
+    results are returned as immutable types since they are shared.
+    """
+    hit, segments = _propagate_rays(*_index_splitters(grid, ncols), nrows, ncols, sources)
+    return frozenset(hit), tuple(segments)
+
+
 class Map:
     """
     Represents a 2D map of the tachyon laboratory.
@@ -34,9 +198,11 @@ class Map:
     Attributes:
         nrows (int): Number of rows in the map.
         ncols (int): Number of columns in the map.
-        map (dict[Point, MapCell]): Mapping of positions to cell types.
-        splitters_by_col (dict[int, list[int]]): Splitter rows indexed by column for fast lookup.
+        grid (bytes): The map cells, one byte each, row-major (cell (r, c) is grid[r*ncols + c]).
+        splitter_col_start (array): Offset of each column's rows in splitter_rows, plus the total.
+        splitter_rows (array): Splitter rows, sorted within each column, column by column.
         sources (list[Point]): List of tachyon source positions.
+        traced_sources (tuple[Point, ...]): The sources the last propagate() call traced.
     """
 
     def __init__(self, lines: list[str]):
@@ -44,104 +210,60 @@ class Map:
         Initialize the map from a list of strings.
 
         Args:
-            lines: List of strings representing the map rows.
+            lines: List of strings representing the map rows, without
+                   surrounding whitespace, as returned by get_inputs; shorter
+                   rows are padded with empty cells to the width of the first.
         """
         self.nrows = len(lines)
-        self.ncols = len(lines[0].strip()) if self.nrows > 0 else 0
-        self.map: dict[Point, MapCell] = {}
-        self.splitters_by_col: dict[int, list[int]] = {}
-        self.sources: list[Point] = []
-
-        for row, line in enumerate(lines):
-            for col, char in enumerate(line.strip()):
-                if char == MapCell.SOURCE.value:
-                    self.sources.append(Point(row, col))
-                    self.map[Point(row, col)] = MapCell.SOURCE
-                elif char == MapCell.SPLITTER.value:
-                    if col not in self.splitters_by_col:
-                        self.splitters_by_col[col] = [row]
-                    else:
-                        self.splitters_by_col[col].append(row)
-                    self.map[Point(row, col)] = MapCell.SPLITTER
-
-        for col in self.splitters_by_col:
-            self.splitters_by_col[col].sort()
+        self.ncols = len(lines[0]) if self.nrows > 0 else 0
+        self.grid = ''.join(line.ljust(self.ncols, MapCell.EMPTY.value)[:self.ncols] for line in lines).encode()
+        self.splitter_col_start, self.splitter_rows = _index_splitters(self.grid, self.ncols)
+        self.sources: list[Point] = [Point(*divmod(i, self.ncols)) for i in _find_cells(self.grid, MapCell.SOURCE)]
+        self.traced_sources: tuple[Point, ...] = ()
 
     def __getitem__(self, key: Point) -> MapCell:
         r, c = key
-        if key in self.sources:
-            return MapCell.SOURCE
-        elif c in self.splitters_by_col and r in self.splitters_by_col[c]:
-            return MapCell.SPLITTER
-        else:
-            return MapCell.EMPTY
+        if 0 <= r < self.nrows and 0 <= c < self.ncols:
+            return _CELLS_BY_BYTE.get(self.grid[r * self.ncols + c], MapCell.EMPTY)
+        return MapCell.EMPTY
 
     def __str__(self):
         """Return string representation of the map."""
-        return '\n'.join(''.join(self.__getitem__((r, c)).to_str() for c in range(self.ncols)) for r in range(self.nrows))
-
-    def __splitters_past_row_in_col(self, row: int, col: int) -> list[int]:
-        if col not in self.splitters_by_col:
-            return []
-        return [r for r in self.splitters_by_col[col] if r > row]
+        cells = self.grid.translate(_DISPLAY_CHARS).decode()
+        return '\n'.join(cells[r * self.ncols:(r + 1) * self.ncols] for r in range(self.nrows))
 
     def propagate(self, source: Point = None) -> tuple[set[Point], list[Path]]:
         """
-        Propagate tachyon rays from the given source (or the first source if None).
+        Propagate tachyon rays from the given source (or every source if None).
+
+        All sources are traced in a single pass; beams from different sources
+        merge where they meet, and each splitter is only split once. The
+        sources traced are recorded in traced_sources, for count_paths_to_exit.
 
         Args:
-            source: Starting point for beam propagation (defaults to first source in map)
+            source: Starting point for beam propagation (defaults to all sources in map)
 
         Returns:
             Tuple of (splitters_hit, paths) where:
                 - splitters_hit: Set of Points where splitters were encountered
-                - paths: List of Path objects representing beam segments
+                - paths: List of Path objects representing beam segments, in
+                  the order they were traced (unique, but not sorted)
         """
         if source is None:
             if not self.sources:
                 raise ValueError("No sources defined in the map")
-            source = self.sources[0]
-            if len(self.sources) > 1:
-                raise ValueError("Multiple sources defined - not implemented")
-
-        splitters_hit: set[Point] = set()
-        paths: set[Path] = set()
-
-        active_rays: list[Point] = [source]
-        while active_rays:
-            current = active_rays.pop()
-            r, c = current
-
-            # Skip if already off the map (bottom, left, or right)
-            if r >= self.nrows or c < 0 or c >= self.ncols:
-                continue
-
-            splitters = self.__splitters_past_row_in_col(r, c)
-            if not splitters:
-                # No splitters in this column, ray exits the map
-                paths.add(Path(current, Point(self.nrows, c)))
-                continue
-
-            splitter_row = splitters[0]
-            splitter_pos = Point(splitter_row, c)
-            paths.add(Path(current, splitter_pos))
-
-            if splitter_pos in splitters_hit:
-                # This splitter has already been hit, ray is absorbed
-                continue
-
-            splitters_hit.add(splitter_pos)
-
-            # Create two new beams going left and right
-            left_pos = Point(splitter_row + 1, c - 1)
-            right_pos = Point(splitter_row + 1, c + 1)
-            paths.add(Path(splitter_pos, left_pos))
-            paths.add(Path(splitter_pos, right_pos))
+            sources = tuple(self.sources)
+        else:
+            sources = (source,)
+        self.traced_sources = sources
 
-            active_rays.append(left_pos)
-            active_rays.append(right_pos)
+        hit, segments = _propagate_cached(self.grid, self.nrows, self.ncols, sources)
 
-        return splitters_hit, sorted(list(paths), key=lambda x: x.start.row)
+        width = self.ncols + 2
+        splitters_hit = {_unpack_point(key, width) for key in hit}
+        bounds = iter(segments)
+        paths = [Path(Point(r0, c0), Point(r1, c1)) for r0, c0, r1, c1 in zip(bounds, bounds, bounds, bounds)]
+        return splitters_hit, paths
 
 
 def get_inputs(fileobj: TextIO) -> Map:
@@ -154,65 +276,62 @@ def get_inputs(fileobj: TextIO) -> Map:
     Returns:
         A Map object representing the laboratory layout
     """
-    lines = [line.rstrip('\n') for line in fileobj.readlines() if line.strip()]
+    # One read and split, stripping each line once here rather than in Map
+    lines = [line for line in map(str.strip, fileobj.read().splitlines()) if line]
     return Map(lines)
 
 
-def count_paths_to_exit(lab_map: Map, paths: list[Path]) -> int:
+def count_paths_to_exit(lab_map: Map, paths: list[Path], sources: list[Point] | None = None) -> int:
     """
     Count the total number of distinct paths from source to map exit.
 
     This function traces through all beam paths and counts how many distinct
-    ways a beam can travel from the source to exiting the map. When beams
+    ways a beam can travel from a source to exiting the map. When beams
     split at splitters, both branches are counted as separate paths.
 
-    Since beams always move downward, we can process points in row order
-    (a natural topological ordering) rather than using Kahn's algorithm.
+    Every segment runs strictly downward, so once the segments are sorted by
+    start row, all segments into a point come before any segment out of it.
+    A single sweep over the sorted segments can therefore push each point's
+    final path count on to its successor, with no adjacency lists or
+    separate node ordering.
 
     Args:
         lab_map: The Map object containing the laboratory layout
         paths: List of Path objects representing beam segments from propagate()
+        sources: The sources the paths were traced from; defaults to the
+                 ones the map's last propagate() call traced.
 
     Returns:
-        Total number of distinct paths from source to exit
+        Total number of distinct paths from any of the sources to exit
     """
-    if not lab_map.sources:
+    if sources is None:
+        sources = lab_map.traced_sources
+    if not sources:
         return 0
 
-    # Build adjacency list mapping each point to its successors
-    outgoing: dict[Point, list[Point]] = defaultdict(list)
-    all_nodes = {lab_map.sources[0]}
-
-    for p in paths:
-        outgoing[p.start].append(p.end)
-        all_nodes.add(p.start)
-        all_nodes.add(p.end)
-
-    # Since beams always move downward, we can process points in row order
-    # This gives us a natural topological ordering without needing Kahn's algorithm
-    sorted_nodes = sorted(all_nodes, key=lambda p: (p.row, p.col))
-
-    # Count paths to each node
-    npaths: dict[Point, int] = {lab_map.sources[0]: 1}
-
-    for current in sorted_nodes:
-        if current not in npaths:
-            # This node is not reachable from the source
-            continue
-
-        # Propagate path count to all successors
-        for next_node in outgoing[current]:
-            if next_node not in npaths:
-                npaths[next_node] = 0
-            npaths[next_node] += npaths[current]
-
-    # Count paths that exit the map by finding unique exit points
-    # Beams can exit from bottom (row == nrows), left (col < 0), or right (col >= ncols)
-    exit_points = {
-        p.end for p in paths
-        if p.end.row >= lab_map.nrows or p.end.col < 0 or p.end.col >= lab_map.ncols
-    }
-    total_paths = sum(npaths.get(point, 0) for point in exit_points)
+    # Pack each segment into one int, start point in the high part, so a
+    # plain sort (no key function) orders segments by start row
+    width = lab_map.ncols + 2
+    span = (lab_map.nrows + 1) * width  # exceeds every packed end point
+    edges = sorted(_pack_point(p.start.row, p.start.col, width) * span
+                   + _pack_point(p.end.row, p.end.col, width) for p in paths)
+
+    # Count paths to each (packed) point, sweeping segments in start-row order
+    npaths: dict[int, int] = {_pack_point(source.row, source.col, width): 1 for source in sources}
+    starts: set[int] = set()
+    ends: set[int] = set()
+    for edge in edges:
+        start, end = divmod(edge, span)
+        starts.add(start)
+        ends.add(end)
+        count = npaths.get(start)
+        if count:
+            npaths[end] = npaths.get(end, 0) + count
+
+    # Every on-map point a segment reaches (a splitter, or a cell below one)
+    # starts another segment, so the exit points are exactly the ends that
+    # never start one: off the bottom, left, or right of the map
+    total_paths = sum(npaths.get(point, 0) for point in ends - starts)
 
     return total_paths
 
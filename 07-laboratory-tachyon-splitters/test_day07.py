@@ -4,7 +4,7 @@ Unit tests for Advent of Code 2025 - Day 7: Tachyon Splitting
 """
 import unittest
 from io import StringIO
-from day07 import Map, get_inputs, count_paths_to_exit
+from day07 import Map, MapCell, _propagate_cached, get_inputs, count_paths_to_exit
 
 
 class TestTachyonSplitting(unittest.TestCase):
@@ -180,6 +180,36 @@ class TestTachyonSplitting(unittest.TestCase):
 ..........."""
         self._run_test(input_text, expected_splitters=8, expected_paths=12)
 
+    def test_propagate_paths_are_unique(self):
+        """Test converging beams do not record the same path segment twice."""
+        input_text = """...S...
+.......
+...^...
+.......
+..^.^..
+.......
+...^...
+......."""
+        lab_map = get_inputs(StringIO(input_text))
+        _, paths = lab_map.propagate()
+        self.assertEqual(len(paths), len(set(paths)))
+
+    def test_propagate_repeat_maps_agree(self):
+        """Test maps parsed twice from the same input share one cached propagation."""
+        input_text = """..S..
+.....
+..^..
+.....
+.^.^.
+....."""
+        _propagate_cached.cache_clear()
+        first = get_inputs(StringIO(input_text)).propagate()
+        self.assertEqual(_propagate_cached.cache_info().hits, 0)
+        second = get_inputs(StringIO(input_text)).propagate()
+        self.assertEqual(_propagate_cached.cache_info().hits, 1)
+        self.assertEqual(first[0], second[0])
+        self.assertEqual(sorted(first[1]), sorted(second[1]))
+
     # ===== Edge Cases =====
 
     def test_splitter_in_last_row(self):
@@ -203,6 +233,41 @@ class TestTachyonSplitting(unittest.TestCase):
 ......."""
         self._run_test(input_text, expected_splitters=1, expected_paths=2)
 
+    def test_multiple_sources_merge(self):
+        """Test that beams from several sources are traced together.
+
+        The two sources' split beams meet below the gap between them, so that
+        cell is traced once but carries paths from both sources.
+        """
+        input_text = """.S.S.
+.....
+.^.^.
+....."""
+        self._run_test(input_text, expected_splitters=2, expected_paths=4)
+
+    def test_count_paths_from_one_source(self):
+        """Test counting paths traced from one explicit source ignores the others.
+
+        The first source's split beam lands on the second source, which was
+        not traced, so it must not add a path of its own.
+        """
+        lab_map = get_inputs(StringIO(""".S...
+.^...
+..S..
+....."""))
+        source = lab_map.sources[0]
+        _, paths = lab_map.propagate(source)
+        self.assertEqual(lab_map.traced_sources, (source,))
+        self.assertEqual(count_paths_to_exit(lab_map, paths), 2)
+        self.assertEqual(count_paths_to_exit(lab_map, paths, [source]), 2)
+
+    def test_map_cell_from_str(self):
+        """Test MapCell.from_str round-trips each cell and rejects others."""
+        for cell in MapCell:
+            self.assertIs(MapCell.from_str(cell.to_str()), cell)
+        with self.assertRaises(ValueError):
+            MapCell.from_str('x')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -8,6 +8,9 @@ from dataclasses import dataclass
 from collections import defaultdict
 import functools
 import operator
+import numpy as np
+
+_INT64_MAX = np.iinfo(np.int64).max
 
 
 @dataclass(order=True, frozen=True)
@@ -215,34 +218,57 @@ def get_inputs(fileobj: TextIO) -> list[Point]:
 def nearest_n_neighbours(points: list[Point], n: int = None) -> list[tuple[int, tuple[int, int]]]:
     """Find the n pairs of points with smallest distances.
 
-    Computes all pairwise distances and sorts them, returning the n smallest.
+    Computes all pairwise distances with NumPy broadcasting on an (N, 3)
+    coordinate array, rather than calling Point.dist_sq per pair, then
+    selects and sorts the n smallest.
+
+    Distances are computed in int64 when they are sure to fit, and
+    otherwise in exact Python ints (an object array), which is slower.
 
     Args:
         points: List of points to find nearest neighbors among
         n: Number of closest pairs to return (if None, returns all pairs)
 
     Returns:
-        List of (distance_squared, (index_i, index_j)) tuples, sorted by distance.
-        Indices satisfy i > j (each pair appears once).
+        List of (distance_squared, (index_i, index_j)) tuples, sorted by distance
+        (ties broken by i, then j). Indices satisfy i > j (each pair appears once).
+
+    Raises:
+        ValueError: If n is negative.
     """
+    if n is not None and n < 0:
+        raise ValueError(f"n must be non-negative, got {n}")
+
     n_points = len(points)
     max_pairs = n_points * (n_points - 1) // 2
 
-    if n is None:
+    if n is None or n > max_pairs:
         n = max_pairs
-
-    # Compute all pairwise distances
-    all_distances = []
-    for i, p in enumerate(points):
-        for j, q in enumerate(points):
-            if i <= j:
-                continue
-            dist_sq = p.dist_sq(q)
-            all_distances.append((dist_sq, (i, j)))
-
-    # Sort and return the n smallest
-    all_distances.sort()
-    return all_distances[:n]
+    if n == 0:
+        return []
+
+    # A squared distance is at most 3 * (2 * max |coordinate|)**2
+    coord_rows = [(p.x, p.y, p.z) for p in points]
+    max_abs = max(abs(c) for row in coord_rows for c in row)
+    dtype = np.int64 if 12 * max_abs * max_abs <= _INT64_MAX else object
+
+    # Full squared-distance matrix, then the pairs below the diagonal (i > j),
+    # which tril_indices lists in (i, j) order
+    coords = np.array(coord_rows, dtype=dtype)
+    dist_matrix = ((coords[:, None, :] - coords[None, :, :]) ** 2).sum(axis=-1)
+    rows, cols = np.tril_indices(n_points, -1)
+    distances = dist_matrix[rows, cols]
+
+    if n < max_pairs:
+        # Keep every pair up to the n-th smallest distance (so ties at the
+        # cutoff are resolved by index order below, not by the partition)
+        cutoff = np.partition(distances, n - 1)[n - 1]
+        keep = np.flatnonzero(distances <= cutoff)
+        rows, cols, distances = rows[keep], cols[keep], distances[keep]
+
+    # A stable sort keeps equal distances in (i, j) order
+    order = np.argsort(distances, kind='stable')[:n]
+    return list(zip(distances[order].tolist(), zip(rows[order].tolist(), cols[order].tolist())))
 
 
 def main() -> None:
@@ -228,6 +228,28 @@ class TestNearestNNeighbours(unittest.TestCase):
 
         self.assertEqual(len(neighbours), 3)
 
+    def test_ties_ordered_by_index(self):
+        """Test that equal distances come out in (i, j) order, also at the cutoff"""
+        points = [Point(0, 0, 0), Point(1, 0, 0), Point(2, 0, 0), Point(3, 0, 0)]
+        neighbours = nearest_n_neighbours(points, 2)
+
+        self.assertEqual(neighbours, [(1, (1, 0)), (1, (2, 1))])
+        self.assertEqual([pair for _, pair in nearest_n_neighbours(points)][:3],
+                         [(1, 0), (2, 1), (3, 2)])
+
+    def test_large_coordinates_exact(self):
+        """Test distances beyond int64 range are still exact"""
+        points = [Point(-3 * 10**9, 0, 0), Point(3 * 10**9, 0, 0), Point(0, 0, 0)]
+        neighbours = nearest_n_neighbours(points)
+
+        self.assertEqual(neighbours, [(9 * 10**18, (2, 0)), (9 * 10**18, (2, 1)), (36 * 10**18, (1, 0))])
+
+    def test_negative_n_raises_error(self):
+        """Test that a negative n is rejected"""
+        points = [Point(0, 0, 0), Point(1, 0, 0)]
+        with self.assertRaises(ValueError):
+            nearest_n_neighbours(points, -1)
+
     def test_example_closest_pair(self):
         """Test finding the closest pair from the problem example"""
         points = [